@@ -8,8 +8,27 @@ Implements prompt caching for cost optimization - the system prompt is cached
 for 5 minutes, reducing input token costs by ~90% for cached portions.
 """
 
-from typing import Optional
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional
 import anthropic
+import httpx
+
+
+def _validation_message(biblical_text: str, reference: str, study_content: str) -> str:
+    """Build the user message for a validation request"""
+    return f"""Biblical Reference: {reference}
+
+Biblical Text:
+{biblical_text}
+
+---
+
+Generated Study:
+{study_content}
+
+---
+
+Evaluate this study and return your assessment as JSON."""
 
 
 class ClaudeClient:
@@ -170,19 +189,155 @@ class ClaudeClient:
                 model=validation_model,
                 max_tokens=max_tokens,
                 system=self._build_system_param(system_prompt),
-                messages=[{"role": "user", "content": f"""Biblical Reference: {reference}
+                messages=[{"role": "user", "content": _validation_message(biblical_text, reference, study_content)}],
+            )
 
-Biblical Text:
-{biblical_text}
+            return response.content[0].text
 
----
+        except anthropic.APIError as e:
+            raise Exception(f"Validation API error for {reference}: {e}")
+        except Exception as e:
+            raise Exception(f"Unexpected error validating study for {reference}: {e}")
 
-Generated Study:
-{study_content}
 
----
+class AsyncClaudeClient:
+    """
+    Asyncio counterpart of ClaudeClient for use inside an event loop
+
+    Wraps anthropic.AsyncAnthropic so a web worker can keep serving other
+    requests while a study is being generated.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "claude-sonnet-4-20250514",
+        use_caching: bool = True,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        """
+        Initialize async Claude client
+
+        Args:
+            api_key: Anthropic API key
+            model: Claude model to use (default: claude-sonnet-4-20250514)
+            use_caching: Enable prompt caching for cost optimization (default: True)
+            http_client: Optional shared httpx client (connection pool) to send requests with
+        """
+        self.client = anthropic.AsyncAnthropic(api_key=api_key, http_client=http_client)
+        self.model = model
+        self.use_caching = use_caching
+
+    # Same system parameter format (and prompt caching) as the sync client
+    _build_system_param = ClaudeClient._build_system_param
+
+    async def generate_study(
+        self,
+        text: str,
+        reference: str,
+        system_prompt: str,
+        max_tokens: int = 4000,
+    ) -> str:
+        """
+        Generate a biblical study using Claude
+
+        Args:
+            text: User message (biblical text + instructions)
+            reference: Biblical reference for logging/debugging
+            system_prompt: Engine-specific protocol prompt
+            max_tokens: Maximum response length (default 4000 for ~3000 word outputs)
+
+        Returns:
+            str: Generated study content (markdown formatted)
+
+        Raises:
+            Exception: If Claude API returns an error
+        """
+        try:
+            response = await self.client.messages.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                system=self._build_system_param(system_prompt),
+                messages=[{"role": "user", "content": text}],
+            )
+
+            # Extract text content from response
+            return response.content[0].text
+
+        except anthropic.APIError as e:
+            raise Exception(f"Claude API error for {reference}: {e}")
+        except Exception as e:
+            raise Exception(f"Unexpected error generating study for {reference}: {e}")
+
+    async def stream_study(
+        self,
+        text: str,
+        reference: str,
+        system_prompt: str,
+        max_tokens: int = 4000,
+    ) -> AsyncIterator[str]:
+        """
+        Generate a biblical study, yielding text chunks as they arrive
+
+        Args:
+            text: User message (biblical text + instructions)
+            reference: Biblical reference for logging/debugging
+            system_prompt: Engine-specific protocol prompt
+            max_tokens: Maximum response length
 
-Evaluate this study and return your assessment as JSON."""}],
+        Yields:
+            str: Text chunks as they're generated
+
+        Raises:
+            Exception: If Claude API returns an error
+        """
+        try:
+            async with self.client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                system=self._build_system_param(system_prompt),
+                messages=[{"role": "user", "content": text}],
+            ) as stream:
+                async for text_chunk in stream.text_stream:
+                    yield text_chunk
+
+        except anthropic.APIError as e:
+            raise Exception(f"Claude API error for {reference}: {e}")
+        except Exception as e:
+            raise Exception(f"Unexpected error generating study for {reference}: {e}")
+
+    async def validate_study(
+        self,
+        biblical_text: str,
+        reference: str,
+        study_content: str,
+        system_prompt: str,
+        validation_model: str = "claude-3-5-haiku-20241022",
+        max_tokens: int = 2000,
+    ) -> str:
+        """
+        Validate a generated study for accuracy, helpfulness, and faithfulness.
+
+        Args:
+            biblical_text: The original biblical text that was studied
+            reference: Biblical reference for logging
+            study_content: The generated study to validate
+            system_prompt: Validation protocol prompt
+            validation_model: Model to use for validation (default: Haiku)
+            max_tokens: Maximum response length
+
+        Returns:
+            str: JSON response with validation results
+
+        Raises:
+            Exception: If Claude API returns an error
+        """
+        try:
+            response = await self.client.messages.create(
+                model=validation_model,
+                max_tokens=max_tokens,
+                system=self._build_system_param(system_prompt),
+                messages=[{"role": "user", "content": _validation_message(biblical_text, reference, study_content)}],
             )
 
             return response.content[0].text
@@ -191,3 +346,87 @@ Evaluate this study and return your assessment as JSON."""}],
             raise Exception(f"Validation API error for {reference}: {e}")
         except Exception as e:
             raise Exception(f"Unexpected error validating study for {reference}: {e}")
+
+    def batch_request(
+        self,
+        custom_id: str,
+        text: str,
+        system_prompt: str,
+        max_tokens: int = 4000,
+    ) -> Dict:
+        """
+        Build one entry for create_batch
+
+        Args:
+            custom_id: Caller's ID for matching the result back to the request
+            text: User message (biblical text + instructions)
+            system_prompt: Engine-specific protocol prompt
+            max_tokens: Maximum response length
+
+        Returns:
+            dict in the Message Batches request format
+        """
+        return {
+            "custom_id": custom_id,
+            "params": {
+                "model": self.model,
+                "max_tokens": max_tokens,
+                "system": self._build_system_param(system_prompt),
+                "messages": [{"role": "user", "content": text}],
+            },
+        }
+
+    async def create_batch(self, requests: List[Dict]) -> str:
+        """
+        Submit studies to the Message Batches API
+
+        Batched requests run concurrently on Anthropic's side at half the
+        per-token price, but can take minutes to complete.
+
+        Args:
+            requests: Entries built with batch_request
+
+        Returns:
+            str: Batch ID for wait_for_batch
+
+        Raises:
+            Exception: If Claude API returns an error
+        """
+        try:
+            batch = await self.client.messages.batches.create(requests=requests)
+            return batch.id
+
+        except anthropic.APIError as e:
+            raise Exception(f"Claude API error creating batch: {e}")
+
+    async def wait_for_batch(self, batch_id: str, poll_interval: float = 30.0) -> Dict[str, Optional[str]]:
+        """
+        Wait for a batch to finish and collect its output
+
+        Args:
+            batch_id: ID returned by create_batch
+            poll_interval: Seconds between status checks
+
+        Returns:
+            dict mapping custom_id to generated text, or None for requests
+            that errored, were canceled or expired
+
+        Raises:
+            Exception: If Claude API returns an error
+        """
+        try:
+            batch = await self.client.messages.batches.retrieve(batch_id)
+            while batch.processing_status != "ended":
+                await asyncio.sleep(poll_interval)
+                batch = await self.client.messages.batches.retrieve(batch_id)
+
+            outputs = {}
+            async for entry in await self.client.messages.batches.results(batch_id):
+                if entry.result.type == "succeeded":
+                    outputs[entry.custom_id] = entry.result.message.content[0].text
+                else:
+                    outputs[entry.custom_id] = None
+            return outputs
+
+        except anthropic.APIError as e:
+            raise Exception(f"Claude API error for batch {batch_id}: {e}")
@@ -3,9 +3,14 @@ Base Engine Class
 
 Abstract base class for all interpretation engines.
 Each engine is a thin wrapper that loads its protocol and calls Claude API.
+
+Building the Claude request (build_request) is kept separate from sending it,
+so the same request can be sent blocking (generate) or streamed token by
+token by a caller that holds its own client, then packaged (package_study).
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Dict, Optional
 
 from ..claude_client import ClaudeClient
@@ -43,6 +48,62 @@ class BaseEngine(ABC):
         raise NotImplementedError
 
     @abstractmethod
+    def build_request(
+        self,
+        text: str,
+        reference: str,
+        preferences: Optional[StudyPreferences] = None
+    ) -> Dict:
+        """
+        Build the Claude request for a study without sending it
+
+        Args:
+            text: Biblical text to analyze
+            reference: Biblical reference (e.g., "John 3:16-21")
+            preferences: User preferences; None uses the protocol unchanged
+
+        Returns:
+            dict with keys:
+                - user_message: Wrapped input for Claude
+                - system_prompt: Protocol prompt (customized if preferences given)
+                - max_tokens: Response token limit
+                - metadata: Engine-specific metadata for package_study
+        """
+        raise NotImplementedError
+
+    def package_study(self, reference: str, output: str, request: Dict) -> Dict:
+        """
+        Package Claude's output as a study result
+
+        Args:
+            reference: Biblical reference
+            output: Generated study content (markdown)
+            request: The dict from build_request that produced output
+
+        Returns:
+            dict with keys: engine, reference, content, metadata
+        """
+        return {
+            "engine": self.name,
+            "reference": reference,
+            "content": output,
+            "metadata": {
+                "word_count": len(output.split()),
+                "timestamp": datetime.now().isoformat(),
+                **request["metadata"],
+            },
+        }
+
+    def _send(self, reference: str, request: Dict) -> Dict:
+        """Send a built request to Claude (blocking) and package the result"""
+        output = self.claude.generate_study(
+            text=request["user_message"],
+            reference=reference,
+            system_prompt=request["system_prompt"],
+            max_tokens=request["max_tokens"],
+        )
+        return self.package_study(reference, output, request)
+
     def generate(self, text: str, reference: str) -> Dict:
         """
         Generate study and return formatted output
@@ -54,7 +115,7 @@ class BaseEngine(ABC):
         Returns:
             dict with keys: engine, reference, content, metadata
         """
-        raise NotImplementedError
+        return self._send(reference, self.build_request(text, reference))
 
     def generate_with_preferences(
         self,
@@ -65,9 +126,8 @@ class BaseEngine(ABC):
         """
         Generate study with user preferences applied
 
-        This is a concrete method that engines can override if they need
-        custom preference handling. Default implementation uses protocol_builder
-        to inject preferences into the protocol.
+        Uses protocol_builder (via build_request) to inject preferences into
+        the protocol.
 
         Args:
             text: Biblical text to analyze
@@ -84,7 +144,21 @@ class BaseEngine(ABC):
         # Validate preferences
         preferences.validate()
 
-        # This method should be overridden by subclasses
-        # Default implementation just calls generate() without preferences
-        # (maintains backward compatibility)
-        return self.generate(text, reference)
+        return self._send(reference, self.build_request(text, reference, preferences))
+
+    def _customized_protocol(self, system_prompt: str, constraints: Dict, preferences: StudyPreferences) -> Dict:
+        """
+        Apply preferences to a protocol's system prompt and output constraints
+
+        Args:
+            system_prompt: Protocol SYSTEM_PROMPT
+            constraints: Protocol OUTPUT_CONSTRAINTS
+            preferences: User preferences to apply
+
+        Returns:
+            dict with keys: system_prompt, constraints
+        """
+        return {
+            "system_prompt": build_system_prompt(system_prompt, preferences),
+            "constraints": build_output_constraints(constraints, preferences),
+        }
@@ -6,13 +6,21 @@ through randomized collision vectors. Maximum intensity, building to crescendo.
 """
 
 import random
-from datetime import datetime
 from typing import Dict, Optional
 
 from .base import BaseEngine
 from ..protocols import collision_protocol
 from ..preferences import StudyPreferences
-from ..protocol_builder import build_system_prompt, build_output_constraints
+
+# The six movements of a Collision study, recorded in its metadata
+COLLISION_STEPS = (
+    "anchor_in_antiquity",
+    "collide_with_now",
+    "navigate_rupture",
+    "crystallize_insight",
+    "release_into_future",
+    "generative_outputs",
+)
 
 
 class CollisionEngine(BaseEngine):
@@ -63,24 +71,26 @@ class CollisionEngine(BaseEngine):
 
         return vectors
 
-    def generate(
+    def build_request(
         self,
         text: str,
         reference: str,
+        preferences: Optional[StudyPreferences] = None,
         collision_vector: Optional[str] = None,
         custom_vectors: Optional[Dict[str, str]] = None,
     ) -> Dict:
         """
-        Generate a Collision study
+        Build the Claude request for a Collision study
 
         Args:
             text: Biblical text to analyze
             reference: Biblical reference (e.g., "John 3:16-21")
+            preferences: User preferences; None uses the protocol unchanged
             collision_vector: Optional specific vector to use
             custom_vectors: Optional dict of custom vectors for each category
 
         Returns:
-            dict with keys: engine, reference, content, metadata
+            dict with keys: user_message, system_prompt, max_tokens, metadata
         """
         # Generate or use provided collision vectors
         if custom_vectors:
@@ -91,36 +101,64 @@ class CollisionEngine(BaseEngine):
         # Wrap input according to protocol
         user_message = collision_protocol.INPUT_WRAPPER(text, reference, vectors)
 
-        # Call Claude API with system prompt from protocol
-        # Collision studies are long (3000-5000 words), so use higher max_tokens
-        output = self.claude.generate_study(
-            text=user_message,
-            reference=reference,
-            system_prompt=collision_protocol.SYSTEM_PROMPT,
-            max_tokens=6000,  # ~5000 words output
-        )
+        if preferences is None:
+            # System prompt straight from protocol; Collision studies are
+            # long (3000-5000 words), so use higher max_tokens
+            system_prompt = collision_protocol.SYSTEM_PROMPT
+            constraints = collision_protocol.OUTPUT_CONSTRAINTS
+            max_tokens = 6000  # ~5000 words output
+        else:
+            # Customized prompt and token limit
+            custom = self._customized_protocol(
+                collision_protocol.SYSTEM_PROMPT,
+                collision_protocol.OUTPUT_CONSTRAINTS,
+                preferences
+            )
+            system_prompt = custom["system_prompt"]
+            constraints = custom["constraints"]
+            max_tokens = constraints["max_tokens"]
+
+        metadata = {
+            "constraints": constraints,
+            "collision_vectors": vectors,
+            "steps": list(COLLISION_STEPS),
+        }
+        if preferences is not None:
+            metadata["preferences"] = preferences.to_dict()
 
-        # Package result
         return {
-            "engine": self.name,
-            "reference": reference,
-            "content": output,
-            "metadata": {
-                "word_count": len(output.split()),
-                "timestamp": datetime.now().isoformat(),
-                "constraints": collision_protocol.OUTPUT_CONSTRAINTS,
-                "collision_vectors": vectors,
-                "steps": [
-                    "anchor_in_antiquity",
-                    "collide_with_now",
-                    "navigate_rupture",
-                    "crystallize_insight",
-                    "release_into_future",
-                    "generative_outputs",
-                ],
-            },
+            "user_message": user_message,
+            "system_prompt": system_prompt,
+            "max_tokens": max_tokens,
+            "metadata": metadata,
         }
 
+    def generate(
+        self,
+        text: str,
+        reference: str,
+        collision_vector: Optional[str] = None,
+        custom_vectors: Optional[Dict[str, str]] = None,
+    ) -> Dict:
+        """
+        Generate a Collision study
+
+        Args:
+            text: Biblical text to analyze
+            reference: Biblical reference (e.g., "John 3:16-21")
+            collision_vector: Optional specific vector to use
+            custom_vectors: Optional dict of custom vectors for each category
+
+        Returns:
+            dict with keys: engine, reference, content, metadata
+        """
+        request = self.build_request(
+            text, reference,
+            collision_vector=collision_vector,
+            custom_vectors=custom_vectors,
+        )
+        return self._send(reference, request)
+
     def list_collision_vectors(self, category: Optional[str] = None) -> Dict:
         """
         List available collision vectors
@@ -165,53 +203,9 @@ class CollisionEngine(BaseEngine):
         # Validate preferences
         preferences.validate()
 
-        # Build customized system prompt
-        custom_system_prompt = build_system_prompt(
-            collision_protocol.SYSTEM_PROMPT,
-            preferences
-        )
-
-        # Build customized output constraints
-        custom_constraints = build_output_constraints(
-            collision_protocol.OUTPUT_CONSTRAINTS,
-            preferences
+        request = self.build_request(
+            text, reference, preferences,
+            collision_vector=collision_vector,
+            custom_vectors=custom_vectors,
         )
-
-        # Generate or use provided collision vectors
-        if custom_vectors:
-            vectors = custom_vectors
-        else:
-            vectors = self.generate_collision_vectors(collision_vector)
-
-        # Wrap input according to protocol
-        user_message = collision_protocol.INPUT_WRAPPER(text, reference, vectors)
-
-        # Call Claude API with customized prompt and token limit
-        output = self.claude.generate_study(
-            text=user_message,
-            reference=reference,
-            system_prompt=custom_system_prompt,
-            max_tokens=custom_constraints['max_tokens'],
-        )
-
-        # Package result with preference metadata
-        return {
-            "engine": self.name,
-            "reference": reference,
-            "content": output,
-            "metadata": {
-                "word_count": len(output.split()),
-                "timestamp": datetime.now().isoformat(),
-                "constraints": custom_constraints,
-                "collision_vectors": vectors,
-                "steps": [
-                    "anchor_in_antiquity",
-                    "collide_with_now",
-                    "navigate_rupture",
-                    "crystallize_insight",
-                    "release_into_future",
-                    "generative_outputs",
-                ],
-                "preferences": preferences.to_dict(),
-            },
-        }
+        return self._send(reference, request)
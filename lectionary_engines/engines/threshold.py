@@ -5,13 +5,11 @@ Simple wrapper that loads the protocol and calls Claude API.
 Following mirror-loop pattern: minimal logic, protocol does the work.
 """
 
-from datetime import datetime
 from typing import Dict, Optional
 
 from .base import BaseEngine
 from ..protocols import threshold_protocol
 from ..preferences import StudyPreferences
-from ..protocol_builder import build_system_prompt, build_output_constraints
 
 
 class ThresholdEngine(BaseEngine):
@@ -36,98 +34,49 @@ class ThresholdEngine(BaseEngine):
             "constraints": threshold_protocol.OUTPUT_CONSTRAINTS,
         }
 
-    def generate(self, text: str, reference: str) -> Dict:
-        """
-        Generate a Threshold study
-
-        Args:
-            text: Biblical text to analyze
-            reference: Biblical reference (e.g., "John 3:16-21")
-
-        Returns:
-            dict with keys: engine, reference, content, metadata
-        """
-        # Wrap input according to protocol
-        user_message = threshold_protocol.INPUT_WRAPPER(text, reference)
-
-        # Call Claude API with system prompt from protocol
-        output = self.claude.generate_study(
-            text=user_message,
-            reference=reference,
-            system_prompt=threshold_protocol.SYSTEM_PROMPT,
-            max_tokens=4000,  # ~3000 words output
-        )
-
-        # Package result
-        return {
-            "engine": self.name,
-            "reference": reference,
-            "content": output,
-            "metadata": {
-                "word_count": len(output.split()),
-                "timestamp": datetime.now().isoformat(),
-                "constraints": threshold_protocol.OUTPUT_CONSTRAINTS,
-            },
-        }
-
-    def generate_with_preferences(
+    def build_request(
         self,
         text: str,
         reference: str,
         preferences: Optional[StudyPreferences] = None
     ) -> Dict:
         """
-        Generate a Threshold study with user preferences applied
+        Build the Claude request for a Threshold study
 
         Args:
             text: Biblical text to analyze
             reference: Biblical reference (e.g., "John 3:16-21")
-            preferences: User preferences for customization
+            preferences: User preferences; None uses the protocol unchanged
 
         Returns:
-            dict with keys: engine, reference, content, metadata
+            dict with keys: user_message, system_prompt, max_tokens, metadata
         """
-        from ..preferences import DEFAULT_PREFERENCES
+        # Wrap input according to protocol
+        user_message = threshold_protocol.INPUT_WRAPPER(text, reference)
 
-        # Use default preferences if none provided
         if preferences is None:
-            preferences = DEFAULT_PREFERENCES
-
-        # Validate preferences
-        preferences.validate()
-
-        # Build customized system prompt
-        custom_system_prompt = build_system_prompt(
+            # System prompt straight from protocol
+            return {
+                "user_message": user_message,
+                "system_prompt": threshold_protocol.SYSTEM_PROMPT,
+                "max_tokens": 4000,  # ~3000 words output
+                "metadata": {
+                    "constraints": threshold_protocol.OUTPUT_CONSTRAINTS,
+                },
+            }
+
+        # Customized prompt and token limit, with preference metadata
+        custom = self._customized_protocol(
             threshold_protocol.SYSTEM_PROMPT,
-            preferences
-        )
-
-        # Build customized output constraints
-        custom_constraints = build_output_constraints(
             threshold_protocol.OUTPUT_CONSTRAINTS,
             preferences
         )
-
-        # Wrap input according to protocol
-        user_message = threshold_protocol.INPUT_WRAPPER(text, reference)
-
-        # Call Claude API with customized prompt and token limit
-        output = self.claude.generate_study(
-            text=user_message,
-            reference=reference,
-            system_prompt=custom_system_prompt,
-            max_tokens=custom_constraints['max_tokens'],
-        )
-
-        # Package result with preference metadata
         return {
-            "engine": self.name,
-            "reference": reference,
-            "content": output,
+            "user_message": user_message,
+            "system_prompt": custom["system_prompt"],
+            "max_tokens": custom["constraints"]["max_tokens"],
             "metadata": {
-                "word_count": len(output.split()),
-                "timestamp": datetime.now().isoformat(),
-                "constraints": custom_constraints,
+                "constraints": custom["constraints"],
                 "preferences": preferences.to_dict(),
             },
         }
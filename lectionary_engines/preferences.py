@@ -4,7 +4,7 @@ User Preferences System for Lectionary Engines
 Defines preference data structures for customizing study output based on user needs.
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from typing import Optional, Dict, Any
 
 
@@ -19,6 +19,9 @@ class StudyPreferences:
         language_complexity: 'accessible', 'standard', or 'advanced'
         focus_areas: Free-text description of user interests (optional)
         cultural_artifacts_level: 0-10 scale (0=none, 10=maximum cultural references)
+        prompt_fragment: Prebuilt prompt block for these preferences, from
+            protocol_builder.build_preferences_fragment (optional; built on
+            demand when None). Clear it after changing any other field.
     """
 
     study_length: str = 'medium'  # 'short', 'medium', 'long'
@@ -26,10 +29,13 @@ class StudyPreferences:
     language_complexity: str = 'standard'  # 'accessible', 'standard', 'advanced'
     focus_areas: Optional[str] = None
     cultural_artifacts_level: int = 0  # 0-10 scale (0=off, 10=maximum)
+    prompt_fragment: Optional[str] = field(default=None, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert preferences to dictionary"""
-        return asdict(self)
+        """Convert preferences to dictionary (without the cached prompt_fragment)"""
+        data = asdict(self)
+        del data['prompt_fragment']
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'StudyPreferences':
@@ -8,22 +8,28 @@ Injects customization instructions into base protocol prompts while preserving c
 from typing import Dict, Any
 from .preferences import StudyPreferences
 
+# Version of the text build_preferences_fragment produces. Bump it whenever
+# that text changes, so fragments saved with a profile are rebuilt rather
+# than reused.
+PREFERENCES_FRAGMENT_VERSION = 1
 
-def build_system_prompt(base_prompt: str, preferences: StudyPreferences) -> str:
+
+def build_preferences_fragment(preferences: StudyPreferences) -> str:
     """
-    Build a customized system prompt by injecting user preferences
+    Build the "USER CUSTOMIZATION" block that build_system_prompt injects
+
+    The block depends only on the preferences (not on the engine), so it can
+    be built once per set of preferences - e.g. when a profile is saved - and
+    passed back in via StudyPreferences.prompt_fragment.
 
     Args:
-        base_prompt: The base SYSTEM_PROMPT from a protocol file
         preferences: User's StudyPreferences
 
     Returns:
-        Modified system prompt with preference instructions injected
+        Preference instructions to inject into a protocol prompt
 
-    Example:
-        >>> from lectionary_engines.protocols import threshold_protocol
-        >>> prefs = StudyPreferences(study_length='short', tone_level=7)
-        >>> custom_prompt = build_system_prompt(threshold_protocol.SYSTEM_PROMPT, prefs)
+    Raises:
+        ValueError: If any preference values are invalid
     """
     # Validate preferences
     preferences.validate()
@@ -114,7 +120,7 @@ Pay special attention to how this text speaks to these interests. Let these them
 - Weight references by their power to illuminate, not just their relevance""")
 
     # Build the complete injection block
-    injection = f"""
+    return f"""
 ## USER CUSTOMIZATION
 
 The user has requested the following customizations for this study:
@@ -126,6 +132,28 @@ The user has requested the following customizations for this study:
 ---
 """
 
+
+def build_system_prompt(base_prompt: str, preferences: StudyPreferences) -> str:
+    """
+    Build a customized system prompt by injecting user preferences
+
+    Uses preferences.prompt_fragment when it is set (built ahead of time by
+    build_preferences_fragment), otherwise builds the fragment now.
+
+    Args:
+        base_prompt: The base SYSTEM_PROMPT from a protocol file
+        preferences: User's StudyPreferences
+
+    Returns:
+        Modified system prompt with preference instructions injected
+
+    Example:
+        >>> from lectionary_engines.protocols import threshold_protocol
+        >>> prefs = StudyPreferences(study_length='short', tone_level=7)
+        >>> custom_prompt = build_system_prompt(threshold_protocol.SYSTEM_PROMPT, prefs)
+    """
+    injection = preferences.prompt_fragment or build_preferences_fragment(preferences)
+
     # Insert injection after the opening description but before main methodology
     # Strategy: Split on first occurrence of '##' after the initial description
     # This preserves the engine intro while injecting before the detailed protocol
@@ -8,7 +8,18 @@ import json
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Set
+
+
+# Directories already created by this process (skips repeated mkdir calls)
+_created_dirs: Set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory (and parents) unless this process already has"""
+    if path not in _created_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(path)
 
 
 def sanitize_filename(reference: str) -> str:
@@ -45,13 +56,10 @@ def save_study(study: Dict, output_dir: str = "outputs") -> str:
     Returns:
         str: Path to saved file
     """
-    # Create output directory if it doesn't exist
+    # Create output + metadata directories (once per process)
     output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    # Create metadata directory
     metadata_path = output_path / ".metadata"
-    metadata_path.mkdir(exist_ok=True)
+    _ensure_dir(metadata_path)
 
     # Generate filename
     safe_ref = sanitize_filename(study["reference"])
@@ -69,15 +77,13 @@ word_count: {study['metadata'].get('word_count', 0)}
 
 """
 
-    # Write markdown file
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(frontmatter)
-        f.write(study["content"])
+    # Write markdown file in a single write
+    filepath.write_text(frontmatter + study["content"], encoding="utf-8")
 
     # Save metadata as JSON
     metadata_file = metadata_path / f"{study['engine']}_{safe_ref}_{date_str}.json"
-    with open(metadata_file, "w", encoding="utf-8") as f:
-        json.dump(
+    metadata_file.write_text(
+        json.dumps(
             {
                 "engine": study["engine"],
                 "reference": study["reference"],
@@ -86,9 +92,10 @@ word_count: {study['metadata'].get('word_count', 0)}
                 "constraints": study["metadata"].get("constraints", {}),
                 "filepath": str(filepath),
             },
-            f,
             indent=2,
-        )
+        ),
+        encoding="utf-8",
+    )
 
     return str(filepath)
 
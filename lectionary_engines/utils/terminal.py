@@ -5,14 +5,93 @@ Provides beautiful terminal output for displaying generated studies.
 """
 
 import re
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.text import Text
-from rich.table import Table
+from functools import lru_cache
 
+# Rich is imported lazily inside the display functions so that importing this
+# module (e.g. through the web app's reload workers) doesn't pay its start-up cost
+_console = None
 
-console = Console()
+
+def _get_console():
+    """Return the shared Rich console, creating it on first use"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+@lru_cache(maxsize=64)
+def _markdown(content: str):
+    """
+    Parse a Markdown section for Rich, reusing the parse for repeated content
+
+    Rich tokenizes Markdown when the object is built, so caching the object
+    skips the parse when the same study (or section) is displayed again.
+    """
+    from rich.markdown import Markdown
+    return Markdown(content)
+
+
+def __getattr__(name: str):
+    # Keep `from lectionary_engines.utils.terminal import console` working
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Patterns used to split generated studies into display sections
+_TITLE_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+# Leading "# Title" line and surrounding whitespace of a study intro
+_INTRO_RE = re.compile(r'\A\s*(?:#[ \t]+[^\n]*(?:\n|\Z))?\s*(.*?)\s*\Z', re.DOTALL)
+_STRIP_COLON_RE = re.compile(r'^:.*$', re.MULTILINE)
+_SPLIT_RE = re.compile(r'#+\s*Threshold (One|Two|Three|Four)', re.IGNORECASE)
+_LAYER_SPLIT_RE = re.compile(r'#+\s*Layer (One|Two|Three|Four|Five)', re.IGNORECASE)
+_TECH_RE = re.compile(r'#+\s*Tech Touchpoint(.+?)(?=─{3,}|$)', re.DOTALL | re.IGNORECASE)
+_THROUGH_RE = re.compile(r'(?:The )?Through-Line.*?:(.+?)(?=─{3,}|$)', re.DOTALL | re.IGNORECASE)
+
+# Box-drawing rules shared by the engine displays
+_BORDER_80 = "═" * 80
+_BORDER_78 = "═" * 78
+_DIM_80 = "─" * 80
+_DIM_78 = "─" * 78
+
+
+def _progress_bar(depth: int) -> str:
+    """Render an excavation depth as a 20-cell progress bar"""
+    return "▓" * (depth // 5) + "░" * (20 - depth // 5)
+
+
+# Threshold sections: (name, latin name, subtitle, stratum, depth, progress bar)
+_THRESHOLDS = tuple(
+    (name, latin, subtitle, stratum, depth, _progress_bar(depth))
+    for name, latin, subtitle, stratum, depth in (
+        ("Threshold One", "PRIMA LECTIO", "Archaeological Dive", "I", 10),
+        ("Threshold Two", "SECUNDA LECTIO", "Theological Combustion", "II", 25),
+        ("Threshold Three", "TERTIA LECTIO", "Present Friction", "III", 40),
+        ("Threshold Four", "QUARTA LECTIO", "Embodied Practice", "IV", 60),
+    )
+)
+
+
+def _split_sections(pattern: re.Pattern, content: str):
+    """
+    Split study content on numbered section headings in a single pass
+
+    Args:
+        pattern: Compiled heading pattern whose group 1 is the section number word
+        content: Full study content
+
+    Returns:
+        tuple: (intro, sections) where intro is the text before the first heading
+               and sections maps the lowercased number word to its raw text
+    """
+    matches = list(pattern.finditer(content))
+    sections = {}
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+        sections.setdefault(match.group(1).lower(), content[match.end():end])
+    intro = content[:matches[0].start()] if matches else content
+    return intro, sections
 
 
 def display_study(content: str, engine: str = ""):
@@ -32,116 +111,115 @@ def display_study(content: str, engine: str = ""):
         _display_palimpsest_study(content)
     else:
         # Default display
+        from rich.panel import Panel
+        from rich.text import Text
+
+        console = _get_console()
         if engine:
             header = Text(f"\n{engine.upper()} ENGINE STUDY\n", style="bold cyan")
             console.print(Panel(header, border_style="cyan"))
-        md = Markdown(content)
+        md = _markdown(content)
         console.print(md)
-        console.print("\n" + "─" * 80 + "\n", style="dim")
+        console.print("\n" + _DIM_80 + "\n", style="dim")
 
 
 def _display_threshold_study(content: str):
     """Display Threshold study with archaeological excavation aesthetic"""
+    from rich.console import Group
+    from rich.text import Text
 
     # Extract title
-    title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+    title_match = _TITLE_RE.search(content)
     title = title_match.group(1) if title_match else "Threshold Study"
 
+    # Collect everything and print once at the end
+    renderables = []
+
     # Header
-    console.print("\n")
-    console.print("╔" + "═" * 78 + "╗", style="bold yellow")
-    console.print("║" + f"{'THRESHOLD ENGINE STUDY':^78}" + "║", style="bold yellow")
-    console.print("║" + f"{title:^78}" + "║", style="bold yellow")
-    console.print("╚" + "═" * 78 + "╝", style="bold yellow")
-    console.print()
-
-    # Parse content by thresholds
-    thresholds = [
-        ("Threshold One", "PRIMA LECTIO", "Archaeological Dive", "I", 10),
-        ("Threshold Two", "SECUNDA LECTIO", "Theological Combustion", "II", 25),
-        ("Threshold Three", "TERTIA LECTIO", "Present Friction", "III", 40),
-        ("Threshold Four", "QUARTA LECTIO", "Embodied Practice", "IV", 60),
-    ]
+    renderables.append(Text("\n"))
+    renderables.append(Text.assemble(
+        ("╔" + _BORDER_78 + "╗\n", "bold yellow"),
+        ("║" + f"{'THRESHOLD ENGINE STUDY':^78}" + "║\n", "bold yellow"),
+        ("║" + f"{title:^78}" + "║\n", "bold yellow"),
+        ("╚" + _BORDER_78 + "╝", "bold yellow"),
+    ))
+    renderables.append(Text(""))
 
     # Split content into intro and thresholds
-    parts = re.split(r'#+\s*Threshold (One|Two|Three|Four)', content, flags=re.IGNORECASE)
-
-    # Display intro (before first threshold)
-    if len(parts) > 0 and parts[0].strip():
-        intro = parts[0].strip()
-        # Remove title from intro if present
-        intro = re.sub(r'^#\s+.+$', '', intro, flags=re.MULTILINE).strip()
-        if intro:
-            md = Markdown(intro)
-            console.print(md)
-            console.print()
+    intro, sections = _split_sections(_SPLIT_RE, content)
+
+    # Display intro (before first threshold), minus the title line
+    intro = _INTRO_RE.match(intro).group(1)
+    if intro:
+        renderables.append(_markdown(intro))
+        renderables.append(Text(""))
 
     # Display each threshold
-    for i, (threshold_name, latin_name, subtitle, stratum, depth) in enumerate(thresholds):
+    for i, (threshold_name, latin_name, subtitle, stratum, depth, progress) in enumerate(_THRESHOLDS):
         # Find threshold content
         threshold_num = threshold_name.split()[1]  # "One", "Two", etc.
 
-        # Search for this threshold in parts
-        threshold_content = None
-        for j in range(1, len(parts), 2):  # Odd indices have threshold names
-            if parts[j].lower() == threshold_num.lower() and j + 1 < len(parts):
-                threshold_content = parts[j + 1].strip()
-                break
+        threshold_content = sections.get(threshold_num.lower(), "").strip()
 
         if not threshold_content:
             continue
 
         # Clean up the content
-        threshold_content = re.sub(r'^:.*$', '', threshold_content, flags=re.MULTILINE).strip()
+        threshold_content = _STRIP_COLON_RE.sub('', threshold_content).strip()
 
         # Depth marker
-        progress = "▓" * (depth // 5) + "░" * (20 - depth // 5)
-        console.print("┌" + "─" * 78 + "┐", style="dim yellow")
-        console.print(f"│ EXCAVATION DEPTH: -{depth}m  {progress}{'STRATUM ' + stratum:>30} │", style="yellow")
-        console.print("└" + "─" * 78 + "┘", style="dim yellow")
-        console.print()
+        renderables.append(Text.assemble(
+            ("┌" + _DIM_78 + "┐\n", "dim yellow"),
+            (f"│ EXCAVATION DEPTH: -{depth}m  {progress}{'STRATUM ' + stratum:>30} │\n", "yellow"),
+            ("└" + _DIM_78 + "┘", "dim yellow"),
+        ))
+        renderables.append(Text(""))
 
         # Threshold header
-        console.print("═" * 80, style="bold yellow")
-        console.print(f"  ◆ {latin_name} ◆", style="bold cyan")
-        console.print(f"  {threshold_name}: {subtitle}", style="cyan")
-        console.print("═" * 80, style="bold yellow")
-        console.print()
+        renderables.append(Text.assemble(
+            (_BORDER_80 + "\n", "bold yellow"),
+            (f"  ◆ {latin_name} ◆\n", "bold cyan"),
+            (f"  {threshold_name}: {subtitle}\n", "cyan"),
+            (_BORDER_80, "bold yellow"),
+        ))
+        renderables.append(Text(""))
 
         # Process content for special boxes
         threshold_content = _add_threshold_boxes(threshold_content)
 
         # Display content
-        md = Markdown(threshold_content)
-        console.print(md)
-        console.print()
+        renderables.append(_markdown(threshold_content))
+        renderables.append(Text(""))
 
     # Tech touchpoint section
-    if "Tech Touchpoint" in content or "tech touchpoint" in content.lower():
-        tech_match = re.search(r'#+\s*Tech Touchpoint(.+?)(?=─{3,}|$)', content, re.DOTALL | re.IGNORECASE)
-        if tech_match:
-            console.print("─" * 80, style="dim cyan")
-            console.print("  ⚙ INSTRUMENTUM TECHNOLOGIAE ⚙", style="bold cyan")
-            console.print("  Tech Touchpoint", style="cyan")
-            console.print("─" * 80, style="dim cyan")
-            console.print()
-
-            tech_content = tech_match.group(1).strip()
-            md = Markdown(tech_content)
-            console.print(md)
-            console.print()
+    tech_match = _TECH_RE.search(content)
+    if tech_match:
+        renderables.append(Text.assemble(
+            (_DIM_80 + "\n", "dim cyan"),
+            ("  ⚙ INSTRUMENTUM TECHNOLOGIAE ⚙\n", "bold cyan"),
+            ("  Tech Touchpoint\n", "cyan"),
+            (_DIM_80, "dim cyan"),
+        ))
+        renderables.append(Text(""))
+
+        tech_content = tech_match.group(1).strip()
+        renderables.append(_markdown(tech_content))
+        renderables.append(Text(""))
 
     # Through-line footer
-    if "Through-Line" in content or "through-line" in content.lower():
-        through_line_match = re.search(r'(?:The )?Through-Line.*?:(.+?)(?=─{3,}|$)', content, re.DOTALL | re.IGNORECASE)
-        if through_line_match:
-            console.print("═" * 80, style="bold yellow")
-            console.print("  THE THROUGH-LINE", style="bold cyan")
-            console.print("═" * 80, style="bold yellow")
-            through_text = through_line_match.group(1).strip()
-            console.print(through_text, style="dim")
-            console.print("═" * 80, style="bold yellow")
-            console.print()
+    through_line_match = _THROUGH_RE.search(content)
+    if through_line_match:
+        through_text = through_line_match.group(1).strip()
+        renderables.append(Text.assemble(
+            (_BORDER_80 + "\n", "bold yellow"),
+            ("  THE THROUGH-LINE\n", "bold cyan"),
+            (_BORDER_80 + "\n", "bold yellow"),
+            (through_text + "\n", "dim"),
+            (_BORDER_80, "bold yellow"),
+        ))
+        renderables.append(Text(""))
+
+    _get_console().print(Group(*renderables))
 
 
 def _add_threshold_boxes(content: str) -> str:
@@ -154,26 +232,36 @@ def _add_threshold_boxes(content: str) -> str:
 def _display_collision_study(content: str):
     """Display Collision study with futuristic console aesthetic (existing style)"""
     # Keep existing collision display logic
-    md = Markdown(content)
-    console.print(md)
+    md = _markdown(content)
+    _get_console().print(md)
 
 
 def _display_palimpsest_study(content: str):
     """Display Palimpsest study with sacred manuscript aesthetic"""
+    from rich.console import Group
+    from rich.padding import Padding
+    from rich.styled import Styled
+    from rich.text import Text
 
     # Extract title
-    title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+    title_match = _TITLE_RE.search(content)
     title = title_match.group(1) if title_match else "Palimpsest Study"
 
+    # Collect everything and print once at the end
+    renderables = []
+
     # Header with ornamental design
-    console.print("\n")
-    console.print("╭" + "═" * 78 + "╮", style="bold magenta")
-    console.print("│" + " " * 78 + "│", style="bold magenta")
-    console.print("│" + f"{'✦ PALIMPSEST ENGINE STUDY ✦':^78}" + "│", style="bold magenta")
-    console.print("│" + f"{title:^78}" + "│", style="bold magenta")
-    console.print("│" + " " * 78 + "│", style="bold magenta")
-    console.print("╰" + "═" * 78 + "╯", style="bold magenta")
-    console.print()
+    renderables.append(Text("\n"))
+    renderables.append(Text(
+        "╭" + _BORDER_78 + "╮\n"
+        + "│" + " " * 78 + "│\n"
+        + "│" + f"{'✦ PALIMPSEST ENGINE STUDY ✦':^78}" + "│\n"
+        + "│" + f"{title:^78}" + "│\n"
+        + "│" + " " * 78 + "│\n"
+        + "╰" + _BORDER_78 + "╯",
+        style="bold magenta",
+    ))
+    renderables.append(Text(""))
 
     # PaRDeS layers with Hebrew letters
     layers = [
@@ -185,97 +273,93 @@ def _display_palimpsest_study(content: str):
     ]
 
     # Split content into intro and layers
-    parts = re.split(r'#+\s*Layer (One|Two|Three|Four|Five)', content, flags=re.IGNORECASE)
-
-    # Display intro (before first layer)
-    if len(parts) > 0 and parts[0].strip():
-        intro = parts[0].strip()
-        # Remove title from intro if present
-        intro = re.sub(r'^#\s+.+$', '', intro, flags=re.MULTILINE).strip()
-        if intro:
-            md = Markdown(intro)
-            console.print(md)
-            console.print()
+    intro, sections = _split_sections(_LAYER_SPLIT_RE, content)
+
+    # Display intro (before first layer), minus the title line
+    intro = _INTRO_RE.match(intro).group(1)
+    if intro:
+        renderables.append(_markdown(intro))
+        renderables.append(Text(""))
 
     # Display each layer
     for i, (layer_name, hebrew_letter, english_name, subtitle, tone, color) in enumerate(layers):
         # Find layer content
         layer_num = layer_name.split()[1]  # "One", "Two", etc.
 
-        # Search for this layer in parts
-        layer_content = None
-        for j in range(1, len(parts), 2):  # Odd indices have layer names
-            if parts[j].lower() == layer_num.lower() and j + 1 < len(parts):
-                layer_content = parts[j + 1].strip()
-                break
+        layer_content = sections.get(layer_num.lower(), "").strip()
 
         if not layer_content:
             continue
 
         # Clean up the content
-        layer_content = re.sub(r'^:.*$', '', layer_content, flags=re.MULTILINE).strip()
+        layer_content = _STRIP_COLON_RE.sub('', layer_content).strip()
 
         # Special formatting for Layer 4 (Sod - mystical/contemplative)
         if i == 3:  # Layer Four
-            console.print("╔" + "═" * 78 + "╗", style=color)
-            console.print("║" + " " * 78 + "║", style=color)
-            console.print("║" + f"  {hebrew_letter}   LAYER FOUR: {english_name}".ljust(78) + "║", style=color)
-            console.print("║" + f"      {subtitle}".ljust(78) + "║", style=color)
-            console.print("║" + f"      Tone: {tone}".ljust(78) + "║", style=color)
-            console.print("║" + " " * 78 + "║", style=color)
-            console.print("║" + f"{'[ The tone shifts here - more space, contemplative ]':^78}" + "║", style="dim magenta")
-            console.print("║" + " " * 78 + "║", style=color)
-            console.print("╚" + "═" * 78 + "╝", style=color)
-            console.print()
+            renderables.append(Text.assemble(
+                ("╔" + _BORDER_78 + "╗\n", color),
+                ("║" + " " * 78 + "║\n", color),
+                ("║" + f"  {hebrew_letter}   LAYER FOUR: {english_name}".ljust(78) + "║\n", color),
+                ("║" + f"      {subtitle}".ljust(78) + "║\n", color),
+                ("║" + f"      Tone: {tone}".ljust(78) + "║\n", color),
+                ("║" + " " * 78 + "║\n", color),
+                ("║" + f"{'[ The tone shifts here - more space, contemplative ]':^78}" + "║\n", "dim magenta"),
+                ("║" + " " * 78 + "║\n", color),
+                ("╚" + _BORDER_78 + "╝", color),
+            ))
+            renderables.append(Text(""))
 
             # Add extra spacing for Layer 4 content
             lines = layer_content.split('\n')
             spaced_content = '\n\n'.join(lines)  # Double spacing for contemplative feel
-            md = Markdown(spaced_content)
-            console.print("        ", end="")  # Indent
-            console.print(md, style="dim magenta")
-            console.print()
+            # Indent
+            renderables.append(Padding(Styled(_markdown(spaced_content), "dim magenta"), (0, 0, 0, 8)))
+            renderables.append(Text(""))
 
         else:
             # Regular layer formatting
-            console.print("┏" + "━" * 78 + "┓", style=color)
-            console.print("┃" + f"  {hebrew_letter}   LAYER {['ONE', 'TWO', 'THREE', 'FOUR', 'FIVE'][i]}: {english_name}".ljust(76) + "  ┃", style=color)
-            console.print("┃" + f"      {subtitle}".ljust(76) + "  ┃", style=color)
-            console.print("┃" + f"      Tone: {tone}".ljust(76) + "  ┃", style="dim " + color)
-            console.print("┗" + "━" * 78 + "┛", style=color)
-            console.print()
+            renderables.append(Text.assemble(
+                ("┏" + "━" * 78 + "┓\n", color),
+                ("┃" + f"  {hebrew_letter}   LAYER {['ONE', 'TWO', 'THREE', 'FOUR', 'FIVE'][i]}: {english_name}".ljust(76) + "  ┃\n", color),
+                ("┃" + f"      {subtitle}".ljust(76) + "  ┃\n", color),
+                ("┃" + f"      Tone: {tone}".ljust(76) + "  ┃\n", "dim " + color),
+                ("┗" + "━" * 78 + "┛", color),
+            ))
+            renderables.append(Text(""))
 
             # Display content
-            md = Markdown(layer_content)
-            console.print(md)
-            console.print()
+            renderables.append(_markdown(layer_content))
+            renderables.append(Text(""))
 
     # Tech touchpoint if present
-    if "Tech Touchpoint" in content or "tech touchpoint" in content.lower():
-        tech_match = re.search(r'#+\s*Tech Touchpoint(.+?)(?=─{3,}|$)', content, re.DOTALL | re.IGNORECASE)
-        if tech_match:
-            console.print("─" * 80, style="dim magenta")
-            console.print("  ✦ DIGITAL PRACTICE ✦", style="bold magenta")
-            console.print("  Tech Touchpoint", style="magenta")
-            console.print("─" * 80, style="dim magenta")
-            console.print()
-
-            tech_content = tech_match.group(1).strip()
-            md = Markdown(tech_content)
-            console.print(md)
-            console.print()
+    tech_match = _TECH_RE.search(content)
+    if tech_match:
+        renderables.append(Text.assemble(
+            (_DIM_80 + "\n", "dim magenta"),
+            ("  ✦ DIGITAL PRACTICE ✦\n", "bold magenta"),
+            ("  Tech Touchpoint\n", "magenta"),
+            (_DIM_80, "dim magenta"),
+        ))
+        renderables.append(Text(""))
+
+        tech_content = tech_match.group(1).strip()
+        renderables.append(_markdown(tech_content))
+        renderables.append(Text(""))
 
     # Footer if present
-    if "Through-Line" in content or "through-line" in content.lower():
-        through_line_match = re.search(r'(?:The )?Through-Line.*?:(.+?)(?=─{3,}|$)', content, re.DOTALL | re.IGNORECASE)
-        if through_line_match:
-            console.print("═" * 80, style="bold magenta")
-            console.print("  THE THROUGH-LINE", style="bold cyan")
-            console.print("═" * 80, style="bold magenta")
-            through_text = through_line_match.group(1).strip()
-            console.print(through_text, style="dim")
-            console.print("═" * 80, style="bold magenta")
-            console.print()
+    through_line_match = _THROUGH_RE.search(content)
+    if through_line_match:
+        through_text = through_line_match.group(1).strip()
+        renderables.append(Text.assemble(
+            (_BORDER_80 + "\n", "bold magenta"),
+            ("  THE THROUGH-LINE\n", "bold cyan"),
+            (_BORDER_80 + "\n", "bold magenta"),
+            (through_text + "\n", "dim"),
+            (_BORDER_80, "bold magenta"),
+        ))
+        renderables.append(Text(""))
+
+    _get_console().print(Group(*renderables))
 
 
 def display_error(message: str):
@@ -285,7 +369,7 @@ def display_error(message: str):
     Args:
         message: Error message to display
     """
-    console.print(f"\n[bold red]Error:[/bold red] {message}\n")
+    _get_console().print(f"\n[bold red]Error:[/bold red] {message}\n")
 
 
 def display_success(message: str):
@@ -295,7 +379,7 @@ def display_success(message: str):
     Args:
         message: Success message to display
     """
-    console.print(f"\n[bold green]✓[/bold green] {message}\n")
+    _get_console().print(f"\n[bold green]✓[/bold green] {message}\n")
 
 
 def display_info(message: str):
@@ -305,7 +389,7 @@ def display_info(message: str):
     Args:
         message: Info message to display
     """
-    console.print(f"\n[cyan]ℹ[/cyan] {message}\n")
+    _get_console().print(f"\n[cyan]ℹ[/cyan] {message}\n")
 
 
 def display_warning(message: str):
@@ -315,4 +399,4 @@ def display_warning(message: str):
     Args:
         message: Warning message to display
     """
-    console.print(f"\n[yellow]⚠[/yellow] {message}\n")
+    _get_console().print(f"\n[yellow]⚠[/yellow] {message}\n")
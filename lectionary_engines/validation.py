@@ -6,22 +6,35 @@ helpfulness, and faithfulness. Uses a lightweight review pass with
 a faster model to catch potential issues.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, FrozenSet, Union
 import json
 
+# orjson is optional; it parses validator responses (and serializes results
+# for storage) several times faster
+try:
+    import orjson
+    _json_loads = orjson.loads
 
-@dataclass
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+
+@dataclass(slots=True)
 class AccuracyIssue:
     """A specific accuracy concern in the study"""
-    severity: str  # 'warning', 'caution', 'note'
-    category: str  # 'linguistic', 'historical', 'citation', 'intertextual'
-    claim: str
-    concern: str
-    suggestion: str
+    severity: str = 'note'  # 'warning', 'caution', 'note'
+    category: str = 'other'  # 'linguistic', 'historical', 'citation', 'intertextual'
+    claim: str = ''
+    concern: str = ''
+    suggestion: str = ''
 
 
-@dataclass
+@dataclass(slots=True)
 class TheologicalNote:
     """A theological observation for reader awareness"""
     type: str  # 'speculation', 'contested', 'boundary'
@@ -29,46 +42,71 @@ class TheologicalNote:
     note: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Flag:
     """A user-facing flag about the study"""
-    level: str  # 'critical', 'important', 'minor'
-    message: str
+    level: str = 'minor'  # 'critical', 'important', 'minor'
+    message: str = ''
 
 
-@dataclass
+@dataclass(slots=True)
 class AccuracyResult:
     """Accuracy evaluation results"""
-    score: int
-    confidence: str  # 'high', 'medium', 'low'
+    score: int = 0
+    confidence: str = 'low'  # 'high', 'medium', 'low'
     issues: List[AccuracyIssue] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class HelpfulnessResult:
     """Helpfulness evaluation results"""
-    score: int
+    score: int = 0
     strengths: List[str] = field(default_factory=list)
     weaknesses: List[str] = field(default_factory=list)  # Where it pulls punches
 
 
-@dataclass
+@dataclass(slots=True)
 class FaithfulnessNote:
     """A faithfulness observation"""
-    type: str  # 'celebration', 'concern', 'question'
-    observation: str
+    type: str = 'note'  # 'celebration', 'concern', 'question'
+    observation: str = ''
 
 
-@dataclass
+@dataclass(slots=True)
 class FaithfulnessResult:
     """Faithfulness evaluation results"""
-    score: int
-    textual_honesty: str  # 'excellent', 'good', 'moderate', 'poor'
-    prophetic_courage: str  # 'high', 'medium', 'low'
+    score: int = 0
+    textual_honesty: str = 'moderate'  # 'excellent', 'good', 'moderate', 'poor'
+    prophetic_courage: str = 'medium'  # 'high', 'medium', 'low'
     notes: List[FaithfulnessNote] = field(default_factory=list)
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _field_names(cls) -> FrozenSet[str]:
+    """Names of a dataclass's init fields"""
+    return frozenset(f.name for f in fields(cls) if f.init)
+
+
+def _from_data(cls, data: Dict[str, Any], **overrides):
+    """Build a dataclass from a JSON dict, ignoring unknown keys"""
+    names = _field_names(cls)
+    kwargs = {key: value for key, value in data.items() if key in names}
+    kwargs.update(overrides)
+    return cls(**kwargs)
+
+
+@lru_cache(maxsize=128)
+def _score_color(score: int) -> str:
+    """Map a 0-100 score to its display color"""
+    if score >= 80:
+        return 'green'
+    elif score >= 60:
+        return 'yellow'
+    else:
+        return 'red'
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """
     Complete validation result for a generated study.
@@ -95,14 +133,22 @@ class ValidationResult:
     summary: str
     raw_response: Optional[Dict[str, Any]] = None
     validation_error: Optional[str] = None
+    # Memoized to_dict() output (results are not mutated after construction)
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _display_flags: Optional[List[Dict[str, str]]] = field(default=None, init=False, repr=False, compare=False)
+    _critical_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Count critical flags once; has_critical_issues() and __repr__ read it
+        self._critical_count = sum(1 for f in self.flags if f.level == 'critical')
 
     @classmethod
-    def from_json(cls, json_str: str) -> 'ValidationResult':
+    def from_json(cls, json_str: Union[str, bytes]) -> 'ValidationResult':
         """
         Parse validation result from JSON response.
 
         Args:
-            json_str: JSON string from validation API call
+            json_str: JSON text (str or raw bytes) from validation API call
 
         Returns:
             ValidationResult instance
@@ -111,57 +157,28 @@ class ValidationResult:
             ValueError: If JSON is invalid or missing required fields
         """
         try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError as e:
+            data = _json_loads(json_str)
+        except json.JSONDecodeError as e:  # orjson's error subclasses this
             # Return a failed validation result
             return cls.failed(f"Invalid JSON response: {e}")
 
         try:
-            # Parse accuracy
+            # Parse nested sections; missing keys fall back to the dataclass defaults
             acc_data = data.get('accuracy', {})
-            accuracy = AccuracyResult(
-                score=acc_data.get('score', 0),
-                confidence=acc_data.get('confidence', 'low'),
-                issues=[
-                    AccuracyIssue(
-                        severity=issue.get('severity', 'note'),
-                        category=issue.get('category', 'other'),
-                        claim=issue.get('claim', ''),
-                        concern=issue.get('concern', ''),
-                        suggestion=issue.get('suggestion', '')
-                    )
-                    for issue in acc_data.get('issues', [])
-                ]
+            accuracy = _from_data(
+                AccuracyResult, acc_data,
+                issues=[_from_data(AccuracyIssue, issue) for issue in acc_data.get('issues', [])]
             )
 
-            # Parse helpfulness
-            help_data = data.get('helpfulness', {})
-            helpfulness = HelpfulnessResult(
-                score=help_data.get('score', 0),
-                strengths=help_data.get('strengths', []),
-                weaknesses=help_data.get('weaknesses', [])
-            )
+            helpfulness = _from_data(HelpfulnessResult, data.get('helpfulness', {}))
 
-            # Parse faithfulness
             faith_data = data.get('faithfulness', {})
-            faithfulness = FaithfulnessResult(
-                score=faith_data.get('score', 0),
-                textual_honesty=faith_data.get('textual_honesty', 'moderate'),
-                prophetic_courage=faith_data.get('prophetic_courage', 'medium'),
-                notes=[
-                    FaithfulnessNote(
-                        type=note.get('type', 'note'),
-                        observation=note.get('observation', '')
-                    )
-                    for note in faith_data.get('notes', [])
-                ]
+            faithfulness = _from_data(
+                FaithfulnessResult, faith_data,
+                notes=[_from_data(FaithfulnessNote, note) for note in faith_data.get('notes', [])]
             )
 
-            # Parse flags
-            flags = [
-                Flag(level=flag.get('level', 'minor'), message=flag.get('message', ''))
-                for flag in data.get('flags', [])
-            ]
+            flags = [_from_data(Flag, flag) for flag in data.get('flags', [])]
 
             return cls(
                 overall_score=data.get('overall_score', 0),
@@ -218,70 +235,68 @@ class ValidationResult:
 
     def has_critical_issues(self) -> bool:
         """Check if there are critical flags"""
-        return any(f.level == 'critical' for f in self.flags)
+        return self._critical_count > 0
+
+    @property
+    def display_flags(self) -> List[Dict[str, str]]:
+        """Flags formatted for UI display (built once per result)"""
+        if self._display_flags is None:
+            self._display_flags = [
+                {'level': f.level, 'message': f.message}
+                for f in self.flags
+            ]
+        return self._display_flags
+
+    @property
+    def score_color(self) -> str:
+        """Color code for score display"""
+        return _score_color(self.overall_score)
 
     def get_display_flags(self) -> List[Dict[str, str]]:
         """Get flags formatted for UI display"""
-        return [
-            {'level': f.level, 'message': f.message}
-            for f in self.flags
-        ]
+        return self.display_flags
 
     def get_score_color(self) -> str:
         """Get color code for score display"""
-        if self.overall_score >= 80:
-            return 'green'
-        elif self.overall_score >= 60:
-            return 'yellow'
-        else:
-            return 'red'
+        return self.score_color
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        return {
-            'overall_score': self.overall_score,
-            'recommendation': self.recommendation,
-            'vibe': self.vibe,
-            'accuracy': {
-                'score': self.accuracy.score,
-                'confidence': self.accuracy.confidence,
-                'issues': [
-                    {
-                        'severity': i.severity,
-                        'category': i.category,
-                        'claim': i.claim,
-                        'concern': i.concern,
-                        'suggestion': i.suggestion
-                    }
-                    for i in self.accuracy.issues
-                ]
-            },
-            'helpfulness': {
-                'score': self.helpfulness.score,
-                'strengths': self.helpfulness.strengths,
-                'weaknesses': self.helpfulness.weaknesses
-            },
-            'faithfulness': {
-                'score': self.faithfulness.score,
-                'textual_honesty': self.faithfulness.textual_honesty,
-                'prophetic_courage': self.faithfulness.prophetic_courage,
-                'notes': [
-                    {
-                        'type': n.type,
-                        'observation': n.observation
-                    }
-                    for n in self.faithfulness.notes
-                ]
-            },
-            'flags': [{'level': f.level, 'message': f.message} for f in self.flags],
-            'summary': self.summary,
-            'validation_error': self.validation_error
-        }
+        """
+        Convert to dictionary for JSON serialization
+
+        The dict is built once and reused on later calls; treat it as read-only.
+        """
+        if self._cached_dict is not None:
+            return self._cached_dict
+
+        # Nested results are converted with asdict(); raw_response is left out and
+        # never copied, and the non-init cache fields are skipped
+        result = {}
+        for f in fields(self):
+            if not f.init or f.name == 'raw_response':
+                continue
+            value = getattr(self, f.name)
+            if f.name == 'flags':
+                value = [asdict(flag) for flag in value]
+            elif is_dataclass(value):
+                value = asdict(value)
+            result[f.name] = value
+        self._cached_dict = result
+        return self._cached_dict
+
+    def to_json(self) -> str:
+        """
+        Serialize to JSON text for storage (the to_dict() fields)
+
+        Returns:
+            Compact JSON string; from_json reads it back
+        """
+        return _json_dumps(self.to_dict())
 
     def __repr__(self) -> str:
         """String representation for debugging"""
         flag_count = len(self.flags)
-        critical = sum(1 for f in self.flags if f.level == 'critical')
+        critical = self._critical_count
         return (
             f"ValidationResult("
             f"score={self.overall_score}, "
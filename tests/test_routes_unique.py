@@ -0,0 +1,22 @@
+"""
+Route table checks for the web app
+
+Two handlers registered for the same method and path fail silently: only
+the first one registered is ever reached.
+"""
+
+from collections import Counter
+
+from web.app import app
+
+
+def test_no_duplicate_routes():
+    """Every (method, path) pair is handled by exactly one route"""
+    pairs = Counter(
+        (method, route.path)
+        for route in app.routes
+        # Mounts (e.g. /static) have no methods
+        for method in getattr(route, 'methods', None) or ()
+    )
+    duplicates = sorted(pair for pair, count in pairs.items() if count > 1)
+    assert not duplicates, f"Duplicate routes: {duplicates}"
@@ -0,0 +1,56 @@
+"""
+Study search: the FTS5 path and the reference-substring fallback
+
+Databases that never ran migration 004 have no studies_fts table; search
+must then fall back to matching the reference instead of failing.
+"""
+
+import asyncio
+
+import orjson
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from web.models import Base, Study
+from web.routes.studies import search_studies_api
+
+STUDIES = [
+    {'engine': 'threshold', 'reference': 'John 3:16-21', 'content': 'For God so loved the world'},
+    {'engine': 'collision', 'reference': 'Psalm 23', 'content': 'The Lord is my shepherd'},
+]
+
+
+async def _search(database_path, q: str, with_fts: bool) -> dict:
+    """Run search_studies_api against a fresh SQLite database and return its JSON body"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            if not with_fts:
+                # As on a database created before migration 004
+                for trigger in ('studies_fts_ai', 'studies_fts_ad', 'studies_fts_au'):
+                    await conn.exec_driver_sql(f'DROP TRIGGER {trigger}')
+                await conn.exec_driver_sql('DROP TABLE studies_fts')
+            await conn.execute(insert(Study), STUDIES)
+
+        async with async_sessionmaker(engine)() as db:
+            response = await search_studies_api(q=q, limit=50, db=db)
+        return orjson.loads(response.body)
+    finally:
+        await engine.dispose()
+
+
+def test_search_matches_content_with_fts(tmp_path):
+    """With the FTS5 index, search also matches study content"""
+    body = asyncio.run(_search(tmp_path / 'fts.db', 'shepherd', with_fts=True))
+    assert [study['reference'] for study in body['studies']] == ['Psalm 23']
+
+
+def test_search_falls_back_to_reference_without_fts(tmp_path):
+    """Without studies_fts, search matches on the reference instead of failing"""
+    body = asyncio.run(_search(tmp_path / 'no_fts.db', 'john', with_fts=False))
+    assert [study['reference'] for study in body['studies']] == ['John 3:16-21']
+
+    # Content isn't searched by the fallback
+    body = asyncio.run(_search(tmp_path / 'no_fts_content.db', 'shepherd', with_fts=False))
+    assert body['total'] == 0
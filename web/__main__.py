@@ -4,9 +4,9 @@ Entry point for running the web application
 
 if __name__ == "__main__":
     import uvicorn
-    from .config import WebConfig
+    from .config import get_config
 
-    config = WebConfig.load()
+    config = get_config()
 
     print("=" * 60)
     print("Lectionary Engines - Web Application")
@@ -16,5 +16,6 @@ if __name__ == "__main__":
         "web.app:app",
         host=config.web_host,
         port=config.web_port,
-        reload=True
+        reload=config.web_reload,
+        workers=1 if config.web_reload else config.web_workers
     )
@@ -6,20 +6,47 @@ FastAPI-based web interface for biblical interpretation engines
 from fastapi import FastAPI, Request, Depends
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
-from contextlib import asynccontextmanager
-from sqlalchemy.orm import Session
-import markdown
-import json
+from fastapi.responses import HTMLResponse, Response
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime, time, timedelta
+from functools import lru_cache
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload
+import asyncio
 from pathlib import Path
+from typing import Optional
 
 from .database import init_db, close_db, get_db
 from .routes import studies, profiles
-from .models import Study
-from .config import WebConfig
+from .routes.studies import get_generator_service
+from .services.markdown_renderer import render_markdown
+from .models import Study, STUDY_SUMMARY_COLUMNS
+from .config import WebConfig, get_config
+from .cache import recent_studies_cache, RECENT_STUDIES_KEY
+from .responses import UTCJSONResponse
+from lectionary_engines.validation import ValidationResult
 
-# Load configuration
-config = WebConfig.load()
+# Daily readings are refreshed shortly after midnight (server local time)
+DAILY_PREFETCH_TIME = time(0, 5)
+
+
+async def _prefetch_daily_readings():
+    """
+    Warm today's RCL readings at startup and again after each midnight
+
+    The first user of the day then skips the scrape as well.
+    """
+    while True:
+        try:
+            await get_generator_service().prefetch_rcl()
+        except Exception as e:
+            # Non-critical: a miss just means the first request scrapes
+            print(f"Daily reading prefetch failed: {e}")
+
+        now = datetime.now()
+        next_run = datetime.combine(now.date() + timedelta(days=1), DAILY_PREFETCH_TIME)
+        await asyncio.sleep((next_run - now).total_seconds())
 
 # Lifespan context manager for startup/shutdown
 @asynccontextmanager
@@ -28,26 +55,92 @@ async def lifespan(app: FastAPI):
     Application lifespan - startup and shutdown events
     """
     # Startup: Initialize database
-    print("Starting Lectionary Engines Web Application...")
-    init_db()
-    print(f"API Key configured: {'✓' if config.anthropic_api_key else '✗'}")
-    print(f"Default translation: {config.default_translation}")
-    print(f"Default engine: {config.default_engine}")
-    print(f"Server running at http://{config.web_host}:{config.web_port}")
+    config = get_config()
+    print("\n".join([
+        "Starting Lectionary Engines Web Application...",
+        f"API Key configured: {'✓' if config.anthropic_api_key else '✗'}",
+        f"Default translation: {config.default_translation}",
+        f"Default engine: {config.default_engine}",
+        f"Server running at http://{config.web_host}:{config.web_port}",
+    ]), flush=True)
+
+    # Create tables (awaited on the async engine, so the loop isn't blocked)
+    await init_db()
+
+    prefetch_task = None
+    if config.anthropic_api_key:
+        prefetch_task = asyncio.create_task(_prefetch_daily_readings())
 
     yield
 
-    # Shutdown: Close database connections
+    # Shutdown: Stop the prefetch loop and close database connections
     print("Shutting down...")
-    close_db()
+    if prefetch_task is not None:
+        prefetch_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await prefetch_task
+    if get_generator_service.cache_info().currsize:
+        await get_generator_service().aclose()
+    await close_db()
+
+
+@lru_cache(maxsize=256)
+def _parse_validation(validation_data: str) -> Optional[ValidationResult]:
+    """
+    Parse a study's stored validation JSON for template access
+
+    Builds the same slotted ValidationResult dataclasses the validator
+    produces (unknown keys are ignored), and is cached by the JSON text,
+    which only changes when a study is re-validated.
+
+    Returns:
+        ValidationResult, or None if the stored JSON can't be parsed
+    """
+    validation = ValidationResult.from_json(validation_data)
+    return None if validation.validation_error else validation
+
+
+# Study pages may be reused by the browser for a minute, then revalidated by ETag
+PAGE_CACHE_CONTROL = "private, max-age=60"
+
+# A study page still waiting on validation changes as soon as the result is
+# stored, so the browser revalidates it on every load
+PENDING_CACHE_CONTROL = "private, no-cache"
+
+
+def _weak_etag(*parts) -> str:
+    """Build a weak ETag from the values that determine a page's content"""
+    return 'W/"' + "-".join(str(part) for part in parts) + '"'
+
+
+def _timestamp_tag(value) -> str:
+    """Compact, microsecond-precision form of a datetime for ETags"""
+    return value.strftime('%Y%m%d%H%M%S%f') if value else '0'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check the request's If-None-Match header against an ETag"""
+    if_none_match = request.headers.get('if-none-match')
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    return etag in (tag.strip() for tag in if_none_match.split(','))
+
+
+def _not_modified(etag: str, cache_control: str = PAGE_CACHE_CONTROL) -> Response:
+    """Empty 304 response for a revalidated page"""
+    return Response(status_code=304, headers={'ETag': etag, 'Cache-Control': cache_control})
 
 
 # Create FastAPI application
+# JSON endpoints serialize with orjson (datetimes natively, marked as UTC)
 app = FastAPI(
     title="Lectionary Engines",
     description="Biblical interpretation through three hermeneutical frameworks",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=UTCJSONResponse
 )
 
 # Get the web directory path
@@ -69,12 +162,24 @@ app.include_router(profiles.router, tags=["profiles"])
 # ============================================================================
 
 @app.get("/", response_class=HTMLResponse)
-async def home(request: Request, db: Session = Depends(get_db)):
+async def home(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    config: WebConfig = Depends(get_config)
+):
     """
     Home page - shows welcome message and recent studies
     """
-    # Get recent studies (last 5)
-    recent_studies = db.query(Study).order_by(Study.created_at.desc()).limit(5).all()
+    # Get recent studies (last 5); cached briefly and invalidated on generate
+    recent_studies = recent_studies_cache.get(RECENT_STUDIES_KEY)
+    if recent_studies is None:
+        result = await db.execute(
+            select(*STUDY_SUMMARY_COLUMNS)
+            .order_by(Study.created_at.desc())
+            .limit(5)
+        )
+        recent_studies = result.all()
+        recent_studies_cache.set(RECENT_STUDIES_KEY, recent_studies)
 
     return templates.TemplateResponse("index.html", {
         "request": request,
@@ -84,7 +189,7 @@ async def home(request: Request, db: Session = Depends(get_db)):
 
 
 @app.get("/generate", response_class=HTMLResponse)
-async def generate_page(request: Request):
+async def generate_page(request: Request, config: WebConfig = Depends(get_config)):
     """
     Study generation page - shows form for generating new study
     """
@@ -98,11 +203,12 @@ async def generate_page(request: Request):
 
 
 @app.get("/study/{study_id}", response_class=HTMLResponse)
-async def view_study(request: Request, study_id: int, db: Session = Depends(get_db)):
+async def view_study(request: Request, study_id: int, db: AsyncSession = Depends(get_db)):
     """
     Study view page - displays a single study with beautiful formatting
     """
-    study = db.query(Study).filter(Study.id == study_id).first()
+    result = await db.execute(select(Study).where(Study.id == study_id))
+    study = result.scalar_one_or_none()
 
     if not study:
         return templates.TemplateResponse("404.html", {
@@ -110,39 +216,44 @@ async def view_study(request: Request, study_id: int, db: Session = Depends(get_
             "message": "Study not found"
         }, status_code=404)
 
-    # Convert markdown to HTML
-    md = markdown.Markdown(extensions=[
-        'extra',          # Tables, footnotes, etc.
-        'nl2br',          # Newline to <br>
-        'sane_lists',     # Better list handling
-    ])
-    study_html = md.convert(study.content)
+    # The page only changes when the study row does; the validation status
+    # is part of the tag too, so a finished validation never matches a
+    # cached "Validating…" page
+    etag = _weak_etag(
+        study.id,
+        _timestamp_tag(study.updated_at or study.created_at),
+        study.validation_status
+    )
+    cache_control = PENDING_CACHE_CONTROL if study.validation_status == 'pending' else PAGE_CACHE_CONTROL
+    if _etag_matches(request, etag):
+        return _not_modified(etag, cache_control)
+
+    # HTML is rendered when the study is saved; rows saved before that are
+    # rendered now and written back (keeping updated_at, so the ETag holds)
+    study_html = study.content_html
+    if study_html is None:
+        study_html = render_markdown(study.content)
+        await db.execute(
+            update(Study)
+            .where(Study.id == study.id)
+            .values(content_html=study_html, updated_at=Study.updated_at)
+        )
+        await db.commit()
 
     # Parse validation data if present
     validation = None
     if study.validation_data:
-        try:
-            validation_dict = json.loads(study.validation_data)
-            # Convert nested dicts to objects for easier template access
-            validation = type('Validation', (), {
-                'overall_score': validation_dict.get('overall_score', 0),
-                'recommendation': validation_dict.get('recommendation', 'review'),
-                'vibe': validation_dict.get('vibe', ''),
-                'accuracy': type('Accuracy', (), validation_dict.get('accuracy', {}))(),
-                'helpfulness': type('Helpfulness', (), validation_dict.get('helpfulness', {}))(),
-                'faithfulness': type('Faithfulness', (), validation_dict.get('faithfulness', {}))(),
-                'flags': validation_dict.get('flags', []),
-                'summary': validation_dict.get('summary', '')
-            })()
-        except (json.JSONDecodeError, TypeError):
-            validation = None
-
-    return templates.TemplateResponse("study.html", {
+        validation = _parse_validation(study.validation_data)
+
+    response = templates.TemplateResponse("study.html", {
         "request": request,
         "study": study,
         "study_html": study_html,
         "validation": validation
     })
+    response.headers['ETag'] = etag
+    response.headers['Cache-Control'] = cache_control
+    return response
 
 
 @app.get("/browse", response_class=HTMLResponse)
@@ -151,7 +262,8 @@ async def browse_studies(
     page: int = 1,
     engine: str = None,
     source: str = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    config: WebConfig = Depends(get_config)
 ):
     """
     Browse studies page - lists all studies with filtering
@@ -160,30 +272,58 @@ async def browse_studies(
     per_page = config.studies_per_page
     skip = (page - 1) * per_page
 
-    # Build query
-    query = db.query(Study)
-
     # Apply filters
+    filters = []
     if engine:
-        query = query.filter(Study.engine == engine)
+        filters.append(Study.engine == engine)
     if source:
-        query = query.filter(Study.source == source)
-
-    # Order by most recent first
-    query = query.order_by(Study.created_at.desc())
-
-    # Get total count before pagination
-    total = query.count()
-
-    # Get studies for this page
-    studies_list = query.offset(skip).limit(per_page).all()
+        filters.append(Study.source == source)
+
+    # Revalidation: the listing only changes when a matching study is added,
+    # removed or updated, so a count + max(updated_at) probe decides a 304
+    if request.headers.get('if-none-match'):
+        stamp = (await db.execute(
+            select(func.count(), func.max(Study.updated_at)).where(*filters)
+        )).one()
+        etag = _weak_etag(stamp[0], _timestamp_tag(stamp[1]))
+        if _etag_matches(request, etag):
+            return _not_modified(etag)
+
+    # Get this page (most recent first), the total match count and the newest
+    # update in one round-trip via window functions. List columns only; the
+    # cards don't show study content. raiseload: list pages must not lazy-load
+    # relationships per row (N+1)
+    result = await db.execute(
+        select(
+            Study,
+            func.count().over().label('total'),
+            func.max(Study.updated_at).over().label('last_updated'),
+        )
+        .options(load_only(*STUDY_SUMMARY_COLUMNS), raiseload('*'))
+        .where(*filters)
+        .order_by(Study.created_at.desc())
+        .offset(skip)
+        .limit(per_page)
+    )
+    rows = result.all()
+    studies_list = [row.Study for row in rows]
+
+    if rows:
+        total, last_updated = rows[0].total, rows[0].last_updated
+    elif skip:
+        # Past the last page: the window values are unavailable, so query directly
+        total, last_updated = (await db.execute(
+            select(func.count(), func.max(Study.updated_at)).where(*filters)
+        )).one()
+    else:
+        total, last_updated = 0, None
 
     # Calculate pagination info
     total_pages = (total + per_page - 1) // per_page
     has_prev = page > 1
     has_next = page < total_pages
 
-    return templates.TemplateResponse("browse.html", {
+    response = templates.TemplateResponse("browse.html", {
         "request": request,
         "studies": studies_list,
         "page": page,
@@ -194,10 +334,13 @@ async def browse_studies(
         "engine_filter": engine,
         "source_filter": source
     })
+    response.headers['ETag'] = _weak_etag(total, _timestamp_tag(last_updated))
+    response.headers['Cache-Control'] = PAGE_CACHE_CONTROL
+    return response
 
 
 @app.get("/health")
-async def health_check():
+async def health_check(config: WebConfig = Depends(get_config)):
     """
     Health check endpoint
     """
@@ -211,9 +354,11 @@ async def health_check():
 # Run the application
 if __name__ == "__main__":
     import uvicorn
+    config = get_config()
     uvicorn.run(
         "web.app:app",
         host=config.web_host,
         port=config.web_port,
-        reload=True
+        reload=config.web_reload,
+        workers=1 if config.web_reload else config.web_workers
     )
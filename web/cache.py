@@ -0,0 +1,82 @@
+"""
+In-process caches for the web app
+
+Small time-based caches for query results that change only when a study is
+created. Each worker process keeps its own copy; writers invalidate the
+relevant keys so the worker that handled the write sees fresh data at once,
+and other workers catch up within the TTL.
+"""
+
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Minimal key/value cache whose entries expire after a fixed number of seconds
+
+    Not thread-safe; it's only touched from the event loop thread.
+    """
+
+    def __init__(self, ttl: float, maxsize: Optional[int] = None):
+        """
+        Args:
+            ttl: Seconds an entry stays valid after it is set
+            maxsize: Maximum number of entries (oldest dropped first); None for no limit
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        """Store value under key for ttl seconds"""
+        self._entries.pop(key, None)
+        if self.maxsize is not None and len(self._entries) >= self.maxsize:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Remove key (invalidate) and return its value if it was cached"""
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self):
+        """Drop every entry"""
+        self._entries.clear()
+
+
+# Home page "recent studies" list (rows of STUDY_SUMMARY_COLUMNS)
+RECENT_STUDIES_KEY = 'recent_5'
+recent_studies_cache = TTLCache(ttl=30)
+
+# Default profile (its to_dict()); cleared by every profile write in this
+# worker, and the TTL bounds how long other workers can serve a stale copy
+DEFAULT_PROFILE_KEY = 'default_profile'
+default_profile_cache = TTLCache(ttl=300)
+
+# Study counts for the list API, keyed by (engine, source) filter; cleared
+# whenever a study is created
+study_count_cache = TTLCache(ttl=30, maxsize=64)
+
+
+def _invalidate_study_caches():
+    """
+    Drop every cached value that a new study makes stale
+
+    Called after each study insert (/generate, the stream save and batch
+    saves); a cache derived from the studies table belongs here.
+    """
+    recent_studies_cache.pop(RECENT_STUDIES_KEY)
+    study_count_cache.clear()
@@ -4,6 +4,7 @@ Extends the base CLI configuration with web-specific settings
 """
 
 import os
+from functools import lru_cache
 from pydantic import Field
 from typing import Optional
 
@@ -43,6 +44,16 @@ class WebConfig(BaseConfig):
         description="Web server port"
     )
 
+    web_reload: bool = Field(
+        default=False,
+        description="Restart the server on code changes (development only)"
+    )
+
+    web_workers: int = Field(
+        default=1,
+        description="Number of uvicorn worker processes (ignored when reloading)"
+    )
+
     # Pagination
     studies_per_page: int = Field(
         default=20,
@@ -80,5 +91,18 @@ class WebConfig(BaseConfig):
             enable_file_sync=os.getenv("ENABLE_FILE_SYNC", "true").lower() == "true",
             web_host=os.getenv("WEB_HOST", "0.0.0.0"),
             web_port=int(os.getenv("WEB_PORT", "8000")),
+            web_reload=os.getenv("WEB_RELOAD", "false").lower() in ("1", "true"),
+            web_workers=int(os.getenv("WEB_WORKERS", "1")),
             studies_per_page=int(os.getenv("STUDIES_PER_PAGE", "20")),
         )
+
+
+@lru_cache(maxsize=1)
+def get_config() -> WebConfig:
+    """
+    Get the web configuration, loading it from the environment once per process
+
+    Returns:
+        Shared WebConfig instance
+    """
+    return WebConfig.load()
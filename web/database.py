@@ -1,81 +1,145 @@
 """
 Database setup and session management for Lectionary Engines web app
+
+Uses SQLAlchemy's asyncio extension so route handlers await database I/O
+instead of blocking the event loop. Migrations keep using sqlite3 directly.
 """
 
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from contextlib import contextmanager
-from typing import Generator
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator
 
 from .models import Base
 
 # Database URL from environment or default to SQLite file
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./lectionary.db")
 
+
+def _async_database_url(url: str) -> str:
+    """
+    Map a plain database URL onto its async driver
+
+    Args:
+        url: Database URL as configured (e.g. sqlite:///./lectionary.db)
+
+    Returns:
+        URL using aiosqlite (SQLite) or asyncpg (PostgreSQL)
+    """
+    if url.startswith("sqlite:"):
+        return "sqlite+aiosqlite:" + url[len("sqlite:"):]
+    for prefix in ("postgres://", "postgresql://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+ASYNC_DATABASE_URL = _async_database_url(DATABASE_URL)
+
+# Default pool size per worker process, as (pool_size, max_overflow). SQLite
+# has a single writer, so extra connections buy little, and each one holds
+# its own page cache (cache_size below); a server database gets more.
+if DATABASE_URL.startswith("sqlite"):
+    DEFAULT_POOL_SIZE, DEFAULT_MAX_OVERFLOW = 5, 10
+else:
+    DEFAULT_POOL_SIZE, DEFAULT_MAX_OVERFLOW = 25, 25
+
+# Connection pool settings shared by all backends: keep connections open
+# between requests, recycle them every 30 minutes and drop dead ones on checkout.
+# Size per worker process; a pooled connection keeps its page cache warm.
+POOL_OPTIONS = {
+    "poolclass": AsyncAdaptedQueuePool,
+    "pool_size": int(os.getenv("DB_POOL_SIZE", DEFAULT_POOL_SIZE)),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", DEFAULT_MAX_OVERFLOW)),
+    "pool_recycle": 1800,
+    "pool_pre_ping": True,
+}
+
 # Create engine
-# For SQLite, we need check_same_thread=False to work with FastAPI
+engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=False,  # Set to True for SQL query logging during development
+    **POOL_OPTIONS
+)
+
 if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        echo=False  # Set to True for SQL query logging during development
+    # SQLite connection tuning: WAL lets readers proceed during a write, and
+    # synchronous=NORMAL is durable under WAL without an fsync per commit
+    SQLITE_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",  # 256 MB
+        "PRAGMA cache_size=-65536",  # 64 MB
+        "PRAGMA foreign_keys=ON",
     )
-else:
-    engine = create_engine(DATABASE_URL, echo=False)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Apply SQLITE_PRAGMAS to each new DBAPI connection"""
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
 
 # Create session maker
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: attributes stay loaded after commit, since an
+# expired attribute can't be lazily refreshed from a template under asyncio
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
 
-def init_db():
+async def init_db():
     """
     Initialize database - create all tables
     Call this when the application starts
     """
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        if DATABASE_URL.startswith("sqlite"):
+            # Refresh planner statistics where they are stale, so filtered
+            # list queries pick the composite indexes
+            await conn.exec_driver_sql("PRAGMA optimize")
     print(f"Database initialized at {DATABASE_URL}")
 
 
-def close_db():
+async def close_db():
     """
     Close database connections
     Call this when the application shuts down
     """
-    engine.dispose()
+    await engine.dispose()
 
 
-@contextmanager
-def get_db_context() -> Generator[Session, None, None]:
+@asynccontextmanager
+async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
     """
     Context manager for database sessions
 
     Usage:
-        with get_db_context() as db:
-            study = db.query(Study).first()
+        async with get_db_context() as db:
+            study = await db.scalar(select(Study))
     """
-    db = SessionLocal()
-    try:
-        yield db
-        db.commit()
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
+    async with SessionLocal() as db:
+        try:
+            yield db
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
 
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for FastAPI routes
 
     Usage:
         @app.get("/studies/{id}")
-        def get_study(id: int, db: Session = Depends(get_db)):
-            return db.query(Study).filter(Study.id == id).first()
+        async def get_study(id: int, db: AsyncSession = Depends(get_db)):
+            return await db.get(Study, id)
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -29,111 +29,102 @@ def upgrade():
     cursor = conn.cursor()
 
     try:
-        # 1. Create user_profiles table
-        print("Creating user_profiles table...")
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS user_profiles (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name VARCHAR(100) NOT NULL UNIQUE,
-                description TEXT,
-                study_length VARCHAR(20) DEFAULT 'medium' NOT NULL,
-                tone_level INTEGER DEFAULT 5 NOT NULL,
-                language_complexity VARCHAR(20) DEFAULT 'standard' NOT NULL,
-                focus_areas TEXT,
-                is_default BOOLEAN DEFAULT 0 NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-
-        # Create indexes for user_profiles
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_is_default ON user_profiles(is_default)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_profile_name ON user_profiles(name)')
-
-        # 2. Add profile tracking columns to studies table
-        print("Adding profile tracking columns to studies table...")
-
-        # Check if columns already exist (in case migration is re-run)
-        cursor.execute("PRAGMA table_info(studies)")
-        columns = [row[1] for row in cursor.fetchall()]
-
-        if 'profile_name' not in columns:
-            cursor.execute('ALTER TABLE studies ADD COLUMN profile_name VARCHAR(100)')
-            print("  ✓ Added profile_name column")
-        else:
-            print("  - profile_name column already exists")
-
-        if 'custom_preferences' not in columns:
-            cursor.execute('ALTER TABLE studies ADD COLUMN custom_preferences TEXT')
-            print("  ✓ Added custom_preferences column")
-        else:
-            print("  - custom_preferences column already exists")
-
-        # 3. Insert default profiles
-        print("Inserting default profiles...")
-
-        default_profiles = [
-            {
-                'name': 'Default',
-                'description': 'Balanced study with moderate depth',
-                'study_length': 'medium',
-                'tone_level': 5,
-                'language_complexity': 'standard',
-                'focus_areas': None,
-                'is_default': True,
-            },
-            {
-                'name': 'Seminary Student',
-                'description': 'Academic depth with technical language',
-                'study_length': 'long',
-                'tone_level': 2,
-                'language_complexity': 'advanced',
-                'focus_areas': 'exegesis, historical context, theological implications',
-                'is_default': False,
-            },
-            {
-                'name': 'Daily Devotional',
-                'description': 'Brief, personal, application-focused',
-                'study_length': 'short',
-                'tone_level': 7,
-                'language_complexity': 'accessible',
-                'focus_areas': 'personal growth, spiritual formation, daily application',
-                'is_default': False,
-            },
-            {
-                'name': 'Small Group Leader',
-                'description': 'Balanced depth with discussion prompts',
-                'study_length': 'medium',
-                'tone_level': 6,
-                'language_complexity': 'standard',
-                'focus_areas': 'group discussion, practical application, community',
-                'is_default': False,
-            },
-            {
-                'name': 'Scholar',
-                'description': 'Maximum depth, technical analysis',
-                'study_length': 'long',
-                'tone_level': 0,
-                'language_complexity': 'advanced',
-                'focus_areas': 'textual criticism, intertextuality, theological development',
-                'is_default': False,
-            },
-        ]
-
-        for profile in default_profiles:
-            # Check if profile already exists
-            cursor.execute('SELECT id FROM user_profiles WHERE name = ?', (profile['name'],))
-            existing = cursor.fetchone()
-
-            if existing:
-                print(f"  - Profile '{profile['name']}' already exists")
-            else:
-                now = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
-                cursor.execute('''
-                    INSERT INTO user_profiles
-                    (name, description, study_length, tone_level, language_complexity, focus_areas, is_default, created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+        # The whole upgrade runs in one transaction: committed on success,
+        # rolled back if any step raises. The explicit BEGIN pulls the DDL in
+        # too (sqlite3 only opens transactions implicitly before DML).
+        with conn:
+            cursor.execute('BEGIN')
+
+            # 1. Create user_profiles table
+            print("Creating user_profiles table...")
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS user_profiles (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name VARCHAR(100) NOT NULL UNIQUE,
+                    description TEXT,
+                    study_length VARCHAR(20) DEFAULT 'medium' NOT NULL,
+                    tone_level INTEGER DEFAULT 5 NOT NULL,
+                    language_complexity VARCHAR(20) DEFAULT 'standard' NOT NULL,
+                    focus_areas TEXT,
+                    is_default BOOLEAN DEFAULT 0 NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            # Create indexes for user_profiles
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_is_default ON user_profiles(is_default)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_profile_name ON user_profiles(name)')
+
+            # 2. Add profile tracking columns to studies table
+            print("Adding profile tracking columns to studies table...")
+
+            # ALTER fails with "duplicate column name" if the migration is re-run
+            for column, column_type in (('profile_name', 'VARCHAR(100)'), ('custom_preferences', 'TEXT')):
+                try:
+                    cursor.execute(f'ALTER TABLE studies ADD COLUMN {column} {column_type}')
+                    print(f"  ✓ Added {column} column")
+                except sqlite3.OperationalError as e:
+                    if 'duplicate column' not in str(e):
+                        raise
+                    print(f"  - {column} column already exists")
+
+            # 3. Insert default profiles
+            print("Inserting default profiles...")
+
+            default_profiles = [
+                {
+                    'name': 'Default',
+                    'description': 'Balanced study with moderate depth',
+                    'study_length': 'medium',
+                    'tone_level': 5,
+                    'language_complexity': 'standard',
+                    'focus_areas': None,
+                    'is_default': True,
+                },
+                {
+                    'name': 'Seminary Student',
+                    'description': 'Academic depth with technical language',
+                    'study_length': 'long',
+                    'tone_level': 2,
+                    'language_complexity': 'advanced',
+                    'focus_areas': 'exegesis, historical context, theological implications',
+                    'is_default': False,
+                },
+                {
+                    'name': 'Daily Devotional',
+                    'description': 'Brief, personal, application-focused',
+                    'study_length': 'short',
+                    'tone_level': 7,
+                    'language_complexity': 'accessible',
+                    'focus_areas': 'personal growth, spiritual formation, daily application',
+                    'is_default': False,
+                },
+                {
+                    'name': 'Small Group Leader',
+                    'description': 'Balanced depth with discussion prompts',
+                    'study_length': 'medium',
+                    'tone_level': 6,
+                    'language_complexity': 'standard',
+                    'focus_areas': 'group discussion, practical application, community',
+                    'is_default': False,
+                },
+                {
+                    'name': 'Scholar',
+                    'description': 'Maximum depth, technical analysis',
+                    'study_length': 'long',
+                    'tone_level': 0,
+                    'language_complexity': 'advanced',
+                    'focus_areas': 'textual criticism, intertextuality, theological development',
+                    'is_default': False,
+                },
+            ]
+
+            # One batched upsert; existing profiles (matched on the unique
+            # name) are left untouched
+            now = datetime.utcnow().isoformat(sep=' ', timespec='seconds')
+            rows = [
+                (
                     profile['name'],
                     profile['description'],
                     profile['study_length'],
@@ -143,15 +134,21 @@ def upgrade():
                     profile['is_default'],
                     now,
                     now,
-                ))
-                print(f"  ✓ Created profile '{profile['name']}'")
+                )
+                for profile in default_profiles
+            ]
+            cursor.executemany('''
+                INSERT INTO user_profiles
+                (name, description, study_length, tone_level, language_complexity, focus_areas, is_default, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(name) DO NOTHING
+            ''', rows)
+            created = cursor.rowcount
+            print(f"  ✓ Created {created} default profile(s), {len(rows) - created} already existed")
 
-        # Commit changes
-        conn.commit()
         print("\n✓ Migration completed successfully!")
 
     except Exception as e:
-        conn.rollback()
         print(f"\n✗ Migration failed: {e}")
         raise
 
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Database Migration: Composite Study Indexes
+
+Replaces the single-column engine/source indexes on studies with composite
+(engine, created_at) and (source, created_at) indexes, so filtered browse
+queries can read rows in created_at order straight from the index.
+
+Run this migration: python3 web/migrations/002_composite_study_indexes.py
+"""
+
+import sys
+from pathlib import Path
+import sqlite3
+
+# Add project to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from web.config import WebConfig
+
+
+def upgrade():
+    """Apply the migration"""
+    config = WebConfig.load()
+    db_path = config.database_url.replace('sqlite:///', '')
+
+    print(f"Applying migration 002_composite_study_indexes to {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        print("Creating composite indexes on studies...")
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_engine_created ON studies(engine, created_at DESC)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_source_created ON studies(source, created_at DESC)')
+
+        # The composite indexes cover lookups on their leading column
+        print("Dropping single-column engine/source indexes...")
+        cursor.execute('DROP INDEX IF EXISTS idx_engine')
+        cursor.execute('DROP INDEX IF EXISTS idx_source')
+
+        # Refresh planner statistics so the new indexes are picked up
+        cursor.execute('ANALYZE studies')
+
+        conn.commit()
+        print("\n✓ Migration completed successfully!")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"\n✗ Migration failed: {e}")
+        raise
+
+    finally:
+        conn.close()
+
+
+def downgrade():
+    """Reverse the migration"""
+    config = WebConfig.load()
+    db_path = config.database_url.replace('sqlite:///', '')
+
+    print(f"Reversing migration 002_composite_study_indexes from {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        print("Restoring single-column engine/source indexes...")
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_engine ON studies(engine)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_source ON studies(source)')
+
+        print("Dropping composite indexes...")
+        cursor.execute('DROP INDEX IF EXISTS idx_engine_created')
+        cursor.execute('DROP INDEX IF EXISTS idx_source_created')
+
+        conn.commit()
+        print("\n✓ Migration reversed successfully!")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"\n✗ Migration reversal failed: {e}")
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Composite Study Indexes Migration')
+    parser.add_argument('--down', action='store_true', help='Reverse the migration')
+    args = parser.parse_args()
+
+    if args.down:
+        downgrade()
+    else:
+        upgrade()
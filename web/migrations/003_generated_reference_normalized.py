@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Database Migration: Generated reference_normalized Column
+
+Turns studies.reference_normalized into a stored generated column,
+lower(trim(reference)), so SQLite keeps it in sync on every write instead of
+the application computing it. SQLite can't change an existing column into a
+generated one, so the studies table is rebuilt and its rows copied across.
+
+Requires SQLite 3.31+ (generated column support).
+
+Run this migration: python3 web/migrations/003_generated_reference_normalized.py
+"""
+
+import sys
+from pathlib import Path
+import sqlite3
+
+# Add project to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from web.config import WebConfig
+
+
+GENERATED_COLUMN = "reference_normalized VARCHAR(255) GENERATED ALWAYS AS (lower(trim(reference))) STORED"
+PLAIN_COLUMN = "reference_normalized VARCHAR(255)"
+
+def _is_generated(cursor) -> bool:
+    """Whether studies.reference_normalized is already a generated column"""
+    # table_xinfo's "hidden" field is 2 (virtual) or 3 (stored) for generated columns
+    cursor.execute("PRAGMA table_xinfo(studies)")
+    return any(row[1] == 'reference_normalized' and row[6] in (2, 3) for row in cursor.fetchall())
+
+
+def _column_definitions(cursor) -> list:
+    """
+    Column definitions for the live studies table, minus reference_normalized
+
+    Built from PRAGMA table_xinfo rather than a fixed list, so columns added
+    by later migrations (validation_status, content_html, ...) survive a
+    rebuild.
+    """
+    cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'studies'")
+    autoincrement = 'AUTOINCREMENT' in cursor.fetchone()[0].upper()
+
+    definitions = []
+    cursor.execute("PRAGMA table_xinfo(studies)")
+    for _, name, column_type, notnull, default, pk, _hidden in cursor.fetchall():
+        if name == 'reference_normalized':
+            continue
+        definition = f"{name} {column_type}".rstrip()
+        if pk:
+            definition += " PRIMARY KEY" + (" AUTOINCREMENT" if autoincrement else "")
+        if notnull:
+            definition += " NOT NULL"
+        if default is not None:
+            definition += f" DEFAULT {default}"
+        definitions.append(definition)
+    return definitions
+
+
+def _rebuild_studies(cursor, reference_normalized_column: str, copy_normalized: bool):
+    """
+    Recreate the studies table with the given reference_normalized definition
+
+    Every other column, index and trigger on studies (including the
+    studies_fts sync triggers from migration 004) is carried over.
+
+    Args:
+        cursor: Cursor inside an open transaction
+        reference_normalized_column: Column definition to use
+        copy_normalized: Copy existing reference_normalized values (only
+                         possible when the new column is a plain column)
+    """
+    definitions = _column_definitions(cursor)
+
+    # table_info leaves out generated columns; table_xinfo lists them too
+    cursor.execute("PRAGMA table_xinfo(studies)")
+    existing = [row[1] for row in cursor.fetchall()]
+    copy_columns = [
+        column for column in existing
+        if column != 'reference_normalized' or copy_normalized
+    ]
+    column_list = ', '.join(copy_columns)
+
+    # DROP TABLE removes the table's indexes and triggers; keep their SQL
+    cursor.execute(
+        "SELECT sql FROM sqlite_master "
+        "WHERE tbl_name = 'studies' AND type IN ('index', 'trigger') AND sql IS NOT NULL "
+        "ORDER BY type"
+    )
+    dependents = [row[0] for row in cursor.fetchall()]
+
+    columns_sql = ',\n    '.join(definitions + [reference_normalized_column])
+    cursor.execute(f'CREATE TABLE studies_new (\n    {columns_sql}\n)')
+    cursor.execute(f'INSERT INTO studies_new ({column_list}) SELECT {column_list} FROM studies')
+    cursor.execute('DROP TABLE studies')
+    cursor.execute('ALTER TABLE studies_new RENAME TO studies')
+
+    for statement in dependents:
+        cursor.execute(statement)
+
+
+def upgrade():
+    """Apply the migration"""
+    config = WebConfig.load()
+    db_path = config.database_url.replace('sqlite:///', '')
+
+    print(f"Applying migration 003_generated_reference_normalized to {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        with conn:
+            cursor.execute('BEGIN')
+
+            if _is_generated(cursor):
+                print("  - reference_normalized is already a generated column")
+            else:
+                print("Rebuilding studies table with generated reference_normalized...")
+                _rebuild_studies(cursor, GENERATED_COLUMN, copy_normalized=False)
+                print("  ✓ reference_normalized now computed as lower(trim(reference))")
+
+        print("\n✓ Migration completed successfully!")
+
+    except Exception as e:
+        print(f"\n✗ Migration failed: {e}")
+        raise
+
+    finally:
+        conn.close()
+
+
+def downgrade():
+    """Reverse the migration"""
+    config = WebConfig.load()
+    db_path = config.database_url.replace('sqlite:///', '')
+
+    print(f"Reversing migration 003_generated_reference_normalized from {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        with conn:
+            cursor.execute('BEGIN')
+
+            if not _is_generated(cursor):
+                print("  - reference_normalized is already a plain column")
+            else:
+                print("Rebuilding studies table with plain reference_normalized...")
+                _rebuild_studies(cursor, PLAIN_COLUMN, copy_normalized=True)
+
+        print("\n✓ Migration reversed successfully!")
+
+    except Exception as e:
+        print(f"\n✗ Migration reversal failed: {e}")
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Generated reference_normalized Migration')
+    parser.add_argument('--down', action='store_true', help='Reverse the migration')
+    args = parser.parse_args()
+
+    if args.down:
+        downgrade()
+    else:
+        upgrade()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Database Migration: Full-Text Search for Studies
+
+Adds the studies_fts FTS5 index (reference, content, biblical_text) with the
+triggers that keep it in sync, and indexes the existing studies.
+
+Run this migration: python3 web/migrations/004_add_studies_fts.py
+"""
+
+import sys
+from pathlib import Path
+import sqlite3
+
+# Add project to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from web.config import WebConfig
+
+
+# Same statements as STUDIES_FTS_DDL in web/models.py (applied there for new databases)
+STUDIES_FTS_DDL = (
+    """CREATE VIRTUAL TABLE IF NOT EXISTS studies_fts USING fts5(
+        reference, content, biblical_text,
+        content='studies', content_rowid='id', tokenize='porter unicode61'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS studies_fts_ai AFTER INSERT ON studies BEGIN
+        INSERT INTO studies_fts(rowid, reference, content, biblical_text)
+        VALUES (new.id, new.reference, new.content, new.biblical_text);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS studies_fts_ad AFTER DELETE ON studies BEGIN
+        INSERT INTO studies_fts(studies_fts, rowid, reference, content, biblical_text)
+        VALUES ('delete', old.id, old.reference, old.content, old.biblical_text);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS studies_fts_au AFTER UPDATE OF reference, content, biblical_text ON studies BEGIN
+        INSERT INTO studies_fts(studies_fts, rowid, reference, content, biblical_text)
+        VALUES ('delete', old.id, old.reference, old.content, old.biblical_text);
+        INSERT INTO studies_fts(rowid, reference, content, biblical_text)
+        VALUES (new.id, new.reference, new.content, new.biblical_text);
+    END""",
+)
+
+
+def upgrade():
+    """Apply the migration"""
+    config = WebConfig.load()
+    db_path = config.database_url.replace('sqlite:///', '')
+
+    print(f"Applying migration 004_add_studies_fts to {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        with conn:
+            cursor.execute('BEGIN')
+
+            print("Creating studies_fts index and sync triggers...")
+            for statement in STUDIES_FTS_DDL:
+                cursor.execute(statement)
+
+            # Index every existing study from the content table
+            print("Indexing existing studies...")
+            cursor.execute("INSERT INTO studies_fts(studies_fts) VALUES ('rebuild')")
+
+        print("\n✓ Migration completed successfully!")
+
+    except Exception as e:
+        print(f"\n✗ Migration failed: {e}")
+        raise
+
+    finally:
+        conn.close()
+
+
+def downgrade():
+    """Reverse the migration"""
+    config = WebConfig.load()
+    db_path = config.database_url.replace('sqlite:///', '')
+
+    print(f"Reversing migration 004_add_studies_fts from {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        with conn:
+            cursor.execute('BEGIN')
+
+            print("Dropping studies_fts triggers and index...")
+            for trigger in ('studies_fts_ai', 'studies_fts_ad', 'studies_fts_au'):
+                cursor.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+            cursor.execute('DROP TABLE IF EXISTS studies_fts')
+
+        print("\n✓ Migration reversed successfully!")
+
+    except Exception as e:
+        print(f"\n✗ Migration reversal failed: {e}")
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Studies Full-Text Search Migration')
+    parser.add_argument('--down', action='store_true', help='Reverse the migration')
+    args = parser.parse_args()
+
+    if args.down:
+        downgrade()
+    else:
+        upgrade()
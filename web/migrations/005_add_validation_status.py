@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Database Migration: Validation Status
+
+Adds a validation_status column to studies. Validation now runs after the
+study is saved, so a study is 'pending' until its validation either
+finishes ('complete') or can't be completed ('failed'); studies generated
+with validation turned off are 'skipped'.
+
+Existing rows are backfilled from their stored validation results.
+
+Run this migration: python3 web/migrations/005_add_validation_status.py
+"""
+
+import sys
+from pathlib import Path
+import sqlite3
+
+# Add project to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from web.config import WebConfig
+
+
+def upgrade():
+    """Apply the migration"""
+    config = WebConfig.load()
+    db_path = config.database_url.replace('sqlite:///', '')
+
+    print(f"Applying migration 005_add_validation_status to {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        columns = {row[1] for row in cursor.execute('PRAGMA table_info(studies)')}
+        if 'validation_status' in columns:
+            print("validation_status already exists; nothing to do")
+            return
+
+        print("Adding validation_status column to studies...")
+        cursor.execute('ALTER TABLE studies ADD COLUMN validation_status VARCHAR(20)')
+
+        print("Backfilling validation_status...")
+        cursor.execute('''
+            UPDATE studies SET validation_status = CASE
+                WHEN validation_recommendation = 'skipped' THEN 'failed'
+                WHEN validation_data IS NULL THEN 'skipped'
+                WHEN json_extract(validation_data, '$.validation_error') IS NOT NULL THEN 'failed'
+                ELSE 'complete'
+            END
+        ''')
+        print(f"  {cursor.rowcount} studies updated")
+
+        conn.commit()
+        print("\n✓ Migration completed successfully!")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"\n✗ Migration failed: {e}")
+        raise
+
+    finally:
+        conn.close()
+
+
+def downgrade():
+    """Reverse the migration"""
+    config = WebConfig.load()
+    db_path = config.database_url.replace('sqlite:///', '')
+
+    print(f"Reversing migration 005_add_validation_status from {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        # DROP COLUMN needs SQLite 3.35+
+        print("Dropping validation_status column from studies...")
+        cursor.execute('ALTER TABLE studies DROP COLUMN validation_status')
+
+        conn.commit()
+        print("\n✓ Migration reversed successfully!")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"\n✗ Migration reversal failed: {e}")
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Validation Status Migration')
+    parser.add_argument('--down', action='store_true', help='Reverse the migration')
+    args = parser.parse_args()
+
+    if args.down:
+        downgrade()
+    else:
+        upgrade()
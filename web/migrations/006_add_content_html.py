@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Database Migration: Rendered Study HTML
+
+Adds a content_html column to studies holding each study's markdown
+rendered to HTML. New studies are rendered when they are saved; existing
+rows are left NULL and rendered (then written back) the first time they
+are viewed, so this migration doesn't need the markdown renderer.
+
+Run this migration: python3 web/migrations/006_add_content_html.py
+"""
+
+import sys
+from pathlib import Path
+import sqlite3
+
+# Add project to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from web.config import WebConfig
+
+
+def upgrade():
+    """Apply the migration"""
+    config = WebConfig.load()
+    db_path = config.database_url.replace('sqlite:///', '')
+
+    print(f"Applying migration 006_add_content_html to {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        columns = {row[1] for row in cursor.execute('PRAGMA table_info(studies)')}
+        if 'content_html' in columns:
+            print("content_html already exists; nothing to do")
+            return
+
+        print("Adding content_html column to studies...")
+        cursor.execute('ALTER TABLE studies ADD COLUMN content_html TEXT')
+
+        conn.commit()
+        print("\n✓ Migration completed successfully!")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"\n✗ Migration failed: {e}")
+        raise
+
+    finally:
+        conn.close()
+
+
+def downgrade():
+    """Reverse the migration"""
+    config = WebConfig.load()
+    db_path = config.database_url.replace('sqlite:///', '')
+
+    print(f"Reversing migration 006_add_content_html from {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        # DROP COLUMN needs SQLite 3.35+
+        print("Dropping content_html column from studies...")
+        cursor.execute('ALTER TABLE studies DROP COLUMN content_html')
+
+        conn.commit()
+        print("\n✓ Migration reversed successfully!")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"\n✗ Migration reversal failed: {e}")
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Rendered Study HTML Migration')
+    parser.add_argument('--down', action='store_true', help='Reverse the migration')
+    args = parser.parse_args()
+
+    if args.down:
+        downgrade()
+    else:
+        upgrade()
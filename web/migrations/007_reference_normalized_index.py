@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Database Migration: reference_normalized Index
+
+Indexes studies.reference_normalized (the generated lower(trim(reference))
+column from migration 003), so looking studies up by reference is an
+indexed equality match instead of a full table scan.
+
+Run this migration: python3 web/migrations/007_reference_normalized_index.py
+"""
+
+import sys
+from pathlib import Path
+import sqlite3
+
+# Add project to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from web.config import WebConfig
+
+
+def upgrade():
+    """Apply the migration"""
+    config = WebConfig.load()
+    db_path = config.database_url.replace('sqlite:///', '')
+
+    print(f"Applying migration 007_reference_normalized_index to {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        print("Creating index on studies.reference_normalized...")
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_reference_normalized ON studies(reference_normalized)')
+
+        # Refresh planner statistics so the new index is picked up
+        cursor.execute('ANALYZE studies')
+
+        conn.commit()
+        print("\n✓ Migration completed successfully!")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"\n✗ Migration failed: {e}")
+        raise
+
+    finally:
+        conn.close()
+
+
+def downgrade():
+    """Reverse the migration"""
+    config = WebConfig.load()
+    db_path = config.database_url.replace('sqlite:///', '')
+
+    print(f"Reversing migration 007_reference_normalized_index from {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        print("Dropping index on studies.reference_normalized...")
+        cursor.execute('DROP INDEX IF EXISTS idx_reference_normalized')
+
+        conn.commit()
+        print("\n✓ Migration reversed successfully!")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"\n✗ Migration reversal failed: {e}")
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='reference_normalized Index Migration')
+    parser.add_argument('--down', action='store_true', help='Reverse the migration')
+    args = parser.parse_args()
+
+    if args.down:
+        downgrade()
+    else:
+        upgrade()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Database Migration: Profile Preferences Prompt
+
+Adds preferences_prompt and preferences_prompt_version columns to
+user_profiles. Each profile's preferences are rendered into the prompt
+block the engines inject once, when the profile is saved, instead of on
+every generation.
+
+Existing profiles are backfilled with the current prompt builder.
+
+Run this migration: python3 web/migrations/008_add_profile_preferences_prompt.py
+"""
+
+import sys
+from pathlib import Path
+import sqlite3
+
+# Add project to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from web.config import WebConfig
+from lectionary_engines.preferences import StudyPreferences
+from lectionary_engines.protocol_builder import build_preferences_fragment, PREFERENCES_FRAGMENT_VERSION
+
+
+def upgrade():
+    """Apply the migration"""
+    config = WebConfig.load()
+    db_path = config.database_url.replace('sqlite:///', '')
+
+    print(f"Applying migration 008_add_profile_preferences_prompt to {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        columns = {row[1] for row in cursor.execute('PRAGMA table_info(user_profiles)')}
+        if 'preferences_prompt' in columns:
+            print("preferences_prompt already exists; nothing to do")
+            return
+
+        print("Adding preferences_prompt columns to user_profiles...")
+        cursor.execute('ALTER TABLE user_profiles ADD COLUMN preferences_prompt TEXT')
+        cursor.execute('ALTER TABLE user_profiles ADD COLUMN preferences_prompt_version INTEGER')
+
+        print("Backfilling preferences_prompt...")
+        profiles = cursor.execute(
+            'SELECT id, study_length, tone_level, language_complexity, focus_areas FROM user_profiles'
+        ).fetchall()
+        for profile_id, study_length, tone_level, language_complexity, focus_areas in profiles:
+            preferences = StudyPreferences(
+                study_length=study_length,
+                tone_level=tone_level,
+                language_complexity=language_complexity,
+                focus_areas=focus_areas,
+            )
+            cursor.execute(
+                'UPDATE user_profiles SET preferences_prompt = ?, preferences_prompt_version = ? WHERE id = ?',
+                (build_preferences_fragment(preferences), PREFERENCES_FRAGMENT_VERSION, profile_id)
+            )
+        print(f"  {len(profiles)} profiles updated")
+
+        conn.commit()
+        print("\n✓ Migration completed successfully!")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"\n✗ Migration failed: {e}")
+        raise
+
+    finally:
+        conn.close()
+
+
+def downgrade():
+    """Reverse the migration"""
+    config = WebConfig.load()
+    db_path = config.database_url.replace('sqlite:///', '')
+
+    print(f"Reversing migration 008_add_profile_preferences_prompt from {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        # DROP COLUMN needs SQLite 3.35+
+        print("Dropping preferences_prompt columns from user_profiles...")
+        cursor.execute('ALTER TABLE user_profiles DROP COLUMN preferences_prompt')
+        cursor.execute('ALTER TABLE user_profiles DROP COLUMN preferences_prompt_version')
+
+        conn.commit()
+        print("\n✓ Migration reversed successfully!")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"\n✗ Migration reversal failed: {e}")
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Profile Preferences Prompt Migration')
+    parser.add_argument('--down', action='store_true', help='Reverse the migration')
+    args = parser.parse_args()
+
+    if args.down:
+        downgrade()
+    else:
+        upgrade()
@@ -3,7 +3,7 @@ Database ORM models for Lectionary Engines web app
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Index
+from sqlalchemy import Column, Computed, DDL, Integer, String, Text, DateTime, Boolean, Index, event, text
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
@@ -20,6 +20,7 @@ class Study(Base):
     engine = Column(String(50), nullable=False)  # 'threshold', 'palimpsest', 'collision'
     reference = Column(String(255), nullable=False)  # 'John 3:16-21'
     content = Column(Text, nullable=False)  # Full markdown content
+    content_html = Column(Text)  # content rendered to HTML (null until first view for older rows)
     word_count = Column(Integer)
 
     # Metadata
@@ -35,6 +36,7 @@ class Study(Base):
     validation_score = Column(Integer)  # Overall score 0-100 (null if not validated)
     validation_recommendation = Column(String(20))  # 'approve', 'review', 'revise'
     validation_data = Column(Text)  # Full validation JSON (for detailed display)
+    validation_status = Column(String(20))  # 'pending', 'complete', 'failed', or 'skipped' (validation turned off)
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -45,21 +47,28 @@ class Study(Base):
     file_synced = Column(Boolean, default=False)
 
     # Search optimization
-    reference_normalized = Column(String(255))  # Lowercase for search
+    # Lowercase for search; computed by the database on insert/update and
+    # indexed, so reference lookups are an equality probe rather than lower() per row
+    reference_normalized = Column(String(255), Computed("lower(trim(reference))", persisted=True))
 
     # Indexes
+    # engine/source filters are always ordered by created_at, so they get
+    # composite indexes that serve both the filter and the sort (and the
+    # filtered COUNT, as a range scan). Their created_at is DESC to match
+    # the newest-first listings, as created by migration 002.
     __table_args__ = (
-        Index('idx_engine', 'engine'),
+        Index('idx_engine_created', 'engine', text('created_at DESC')),
+        Index('idx_source_created', 'source', text('created_at DESC')),
         Index('idx_reference', 'reference'),
+        Index('idx_reference_normalized', 'reference_normalized'),
         Index('idx_created', 'created_at'),
-        Index('idx_source', 'source'),
     )
 
     def __repr__(self):
         return f"<Study(id={self.id}, engine='{self.engine}', reference='{self.reference}')>"
 
     def to_dict(self):
-        """Convert study to dictionary"""
+        """Convert study to dictionary (datetimes are serialized by UTCJSONResponse)"""
         return {
             'id': self.id,
             'engine': self.engine,
@@ -74,12 +83,81 @@ class Study(Base):
             'validation_score': self.validation_score,
             'validation_recommendation': self.validation_recommendation,
             'validation_data': self.validation_data,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'validation_status': self.validation_status,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
             'file_path': self.file_path,
             'file_synced': self.file_synced,
         }
 
+    @staticmethod
+    def to_summary_dict(row) -> dict:
+        """
+        Convert a column-projected study row to a dictionary
+
+        Args:
+            row: Row from a select() of STUDY_LIST_COLUMNS (or any subset)
+
+        Returns:
+            dict keyed by column name
+        """
+        return dict(row._mapping)
+
+
+# Columns needed to render study lists (home, browse); leaves out the large
+# content/biblical_text/validation_data TEXT columns.
+#
+# List queries select these columns directly (select(*STUDY_SUMMARY_COLUMNS)
+# or select(*STUDY_LIST_COLUMNS)) and get plain rows, with no ORM objects to
+# lazy-load from. /browse is the exception: it loads Study objects with
+# load_only(*STUDY_SUMMARY_COLUMNS) plus raiseload('*'), so a relationship
+# touched while rendering fails loudly instead of issuing one SELECT per row.
+STUDY_SUMMARY_COLUMNS = (
+    Study.id,
+    Study.engine,
+    Study.reference,
+    Study.word_count,
+    Study.source,
+    Study.translation,
+    Study.created_at,
+)
+
+# Columns returned by the study list/search APIs: the summary plus the
+# validation outcome. Full content is only served by /api/studies/{id}.
+STUDY_LIST_COLUMNS = STUDY_SUMMARY_COLUMNS + (
+    Study.validation_score,
+    Study.validation_recommendation,
+    Study.validation_status,
+)
+
+
+# Full-text search over studies (SQLite FTS5). studies_fts is an external-content
+# index: it stores only the inverted index and reads text from studies, and the
+# triggers keep it in step with inserts, deletes and edits to the indexed columns.
+STUDIES_FTS_DDL = (
+    """CREATE VIRTUAL TABLE IF NOT EXISTS studies_fts USING fts5(
+        reference, content, biblical_text,
+        content='studies', content_rowid='id', tokenize='porter unicode61'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS studies_fts_ai AFTER INSERT ON studies BEGIN
+        INSERT INTO studies_fts(rowid, reference, content, biblical_text)
+        VALUES (new.id, new.reference, new.content, new.biblical_text);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS studies_fts_ad AFTER DELETE ON studies BEGIN
+        INSERT INTO studies_fts(studies_fts, rowid, reference, content, biblical_text)
+        VALUES ('delete', old.id, old.reference, old.content, old.biblical_text);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS studies_fts_au AFTER UPDATE OF reference, content, biblical_text ON studies BEGIN
+        INSERT INTO studies_fts(studies_fts, rowid, reference, content, biblical_text)
+        VALUES ('delete', old.id, old.reference, old.content, old.biblical_text);
+        INSERT INTO studies_fts(rowid, reference, content, biblical_text)
+        VALUES (new.id, new.reference, new.content, new.biblical_text);
+    END""",
+)
+
+for _statement in STUDIES_FTS_DDL:
+    event.listen(Study.__table__, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+
 
 class UserProfile(Base):
     """User Profile model - stores user preference profiles"""
@@ -98,6 +176,11 @@ class UserProfile(Base):
     language_complexity = Column(String(20), default='standard', nullable=False)  # 'accessible', 'standard', 'advanced'
     focus_areas = Column(Text)  # Free text, user-specified (nullable)
 
+    # Preferences rendered as the prompt block engines inject, built when the
+    # profile is saved; only used while its version matches the builder's
+    preferences_prompt = Column(Text)
+    preferences_prompt_version = Column(Integer)
+
     # Metadata
     is_default = Column(Boolean, default=False, nullable=False)  # Only one profile can be default
 
@@ -115,7 +198,7 @@ class UserProfile(Base):
         return f"<UserProfile(id={self.id}, name='{self.name}', length='{self.study_length}', tone={self.tone_level})>"
 
     def to_dict(self):
-        """Convert profile to dictionary"""
+        """Convert profile to dictionary (datetimes are serialized by UTCJSONResponse)"""
         return {
             'id': self.id,
             'name': self.name,
@@ -125,16 +208,76 @@ class UserProfile(Base):
             'language_complexity': self.language_complexity,
             'focus_areas': self.focus_areas,
             'is_default': self.is_default,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
         }
 
     def to_study_preferences(self):
-        """Convert UserProfile to StudyPreferences dataclass"""
+        """
+        Convert UserProfile to StudyPreferences dataclass
+
+        The saved preferences_prompt is passed along as the prompt_fragment
+        when it is current, so engines don't rebuild it.
+        """
         from lectionary_engines.preferences import StudyPreferences
+        from lectionary_engines.protocol_builder import PREFERENCES_FRAGMENT_VERSION
+        current = self.preferences_prompt_version == PREFERENCES_FRAGMENT_VERSION
         return StudyPreferences(
             study_length=self.study_length,
             tone_level=self.tone_level,
             language_complexity=self.language_complexity,
             focus_areas=self.focus_areas,
+            prompt_fragment=self.preferences_prompt if current else None,
         )
+
+    def update_preferences_prompt(self):
+        """Rebuild preferences_prompt; call whenever the preference columns change"""
+        from lectionary_engines.protocol_builder import build_preferences_fragment, PREFERENCES_FRAGMENT_VERSION
+        preferences = self.to_study_preferences()
+        preferences.prompt_fragment = None
+        self.preferences_prompt = build_preferences_fragment(preferences)
+        self.preferences_prompt_version = PREFERENCES_FRAGMENT_VERSION
+
+
+class DailyReading(Base):
+    """
+    Daily reading cache - Moravian and RCL readings for a calendar day
+
+    Those readings are the same for every user all day, so each one is
+    scraped once and reused (across restarts and worker processes).
+    """
+
+    __tablename__ = "daily_readings"
+
+    day = Column(String(10), primary_key=True)  # ISO date, e.g. '2025-01-05'
+    kind = Column(String(20), primary_key=True)  # 'moravian', 'rcl:ot', 'rcl:psalm', 'rcl:epistle', 'rcl:gospel'
+    translation = Column(String(20), primary_key=True)  # '' when the reading has no translation choice
+
+    reference = Column(String(255), nullable=False)
+    text = Column(Text, nullable=False)
+
+    fetched_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<DailyReading(day='{self.day}', kind='{self.kind}', reference='{self.reference}')>"
+
+
+class BiblicalTextCache(Base):
+    """
+    Biblical text cache - passages fetched from Bible Gateway
+
+    A passage's text never changes for a given translation, so each one is
+    fetched once and served from here afterwards.
+    """
+
+    __tablename__ = "biblical_text_cache"
+
+    reference_norm = Column(String(255), primary_key=True)  # lower(trim(reference)), as Study.reference_normalized
+    translation = Column(String(20), primary_key=True)
+
+    text = Column(Text, nullable=False)
+
+    fetched_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<BiblicalTextCache(reference='{self.reference_norm}', translation='{self.translation}')>"
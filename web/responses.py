@@ -0,0 +1,26 @@
+"""
+JSON response class for the web app's API endpoints
+
+Responses are serialized with orjson. Stored timestamps are naive UTC
+(datetime.utcnow), so they are written with an explicit +00:00 offset;
+clients would otherwise read them as local time.
+
+Routes whose data includes datetimes return a UTCJSONResponse themselves.
+A plain dict return value is run through FastAPI's jsonable_encoder first,
+which turns datetimes into naive ISO strings before orjson sees them.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+# orjson options shared by every JSON body the app writes
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC
+
+
+class UTCJSONResponse(ORJSONResponse):
+    """ORJSONResponse that marks naive datetimes as UTC"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
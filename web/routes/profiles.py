@@ -3,76 +3,134 @@ Profile routes - API endpoints for user profile management
 """
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import Optional
-from pydantic import BaseModel, Field
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from typing import Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from ..database import get_db
 from ..models import UserProfile
+from ..cache import default_profile_cache, DEFAULT_PROFILE_KEY
+from ..responses import UTCJSONResponse
 
 router = APIRouter()
 
 
+# Allowed values for the enumerated profile settings
+StudyLength = Literal['short', 'medium', 'long']
+LanguageComplexity = Literal['accessible', 'standard', 'advanced']
+
+# Profile fields that feed the saved preferences_prompt
+PREFERENCE_FIELDS = {'study_length', 'tone_level', 'language_complexity', 'focus_areas'}
+
+
 # Pydantic models for request/response validation
 class ProfileCreate(BaseModel):
     """Request model for creating a profile"""
+    model_config = ConfigDict(extra='forbid', str_strip_whitespace=True)
+
     name: str = Field(..., min_length=1, max_length=100)
     description: Optional[str] = None
-    study_length: str = Field(default='medium', pattern='^(short|medium|long)$')
+    study_length: StudyLength = 'medium'
     tone_level: int = Field(default=5, ge=0, le=8)
-    language_complexity: str = Field(default='standard', pattern='^(accessible|standard|advanced)$')
+    language_complexity: LanguageComplexity = 'standard'
     focus_areas: Optional[str] = None
     is_default: bool = False
 
 
 class ProfileUpdate(BaseModel):
     """Request model for updating a profile"""
+    model_config = ConfigDict(extra='forbid', str_strip_whitespace=True)
+
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     description: Optional[str] = None
-    study_length: Optional[str] = Field(None, pattern='^(short|medium|long)$')
+    study_length: Optional[StudyLength] = None
     tone_level: Optional[int] = Field(None, ge=0, le=8)
-    language_complexity: Optional[str] = Field(None, pattern='^(accessible|standard|advanced)$')
+    language_complexity: Optional[LanguageComplexity] = None
     focus_areas: Optional[str] = None
     is_default: Optional[bool] = None
 
+    @field_validator('name', 'study_length', 'tone_level', 'language_complexity', 'is_default')
+    @classmethod
+    def _not_null(cls, value):
+        """These columns are NOT NULL: leave the field out to keep its value"""
+        if value is None:
+            raise ValueError('may be omitted, but not null')
+        return value
+
+
+def _is_duplicate_name(error: IntegrityError) -> bool:
+    """Whether an IntegrityError is the unique constraint on user_profiles.name"""
+    # SQLite: "UNIQUE constraint failed: user_profiles.name"
+    # PostgreSQL: 'duplicate key value violates unique constraint "user_profiles_name_key"'
+    message = str(error.orig).lower()
+    return 'unique' in message and 'name' in message
+
+
+async def _unset_other_defaults(db: AsyncSession, profile_id: int):
+    """
+    Clear is_default on every profile except profile_id with one UPDATE
+
+    Runs in the caller's transaction, so the new default and the cleared
+    flags commit together and concurrent requests can't leave zero defaults.
+    """
+    await db.execute(
+        update(UserProfile)
+        .where(UserProfile.is_default == True, UserProfile.id != profile_id)
+        .values(is_default=False)
+        .execution_options(synchronize_session=False)
+    )
+
 
 @router.get("/api/profiles")
-async def list_profiles(db: Session = Depends(get_db)):
+async def list_profiles(db: AsyncSession = Depends(get_db)):
     """
     List all user profiles
 
     Returns:
         List of all profiles as JSON
     """
-    profiles = db.query(UserProfile).order_by(
-        UserProfile.is_default.desc(),  # Default first
-        UserProfile.name.asc()  # Then alphabetical
-    ).all()
+    # raiseload: list endpoints must not lazy-load relationships per row (N+1)
+    result = await db.execute(
+        select(UserProfile).options(raiseload('*')).order_by(
+            UserProfile.is_default.desc(),  # Default first
+            UserProfile.name.asc()  # Then alphabetical
+        )
+    )
+    profiles = result.scalars().all()
 
-    return {
+    return UTCJSONResponse({
         'total': len(profiles),
         'profiles': [profile.to_dict() for profile in profiles]
-    }
+    })
 
 
 @router.get("/api/profiles/default")
-async def get_default_profile(db: Session = Depends(get_db)):
+async def get_default_profile(db: AsyncSession = Depends(get_db)):
     """
     Get the default profile
 
     Returns:
         Default profile as JSON
     """
-    profile = db.query(UserProfile).filter(UserProfile.is_default == True).first()
+    cached = default_profile_cache.get(DEFAULT_PROFILE_KEY)
+    if cached is not None:
+        return UTCJSONResponse(cached)
+
+    profile = await db.scalar(select(UserProfile).where(UserProfile.is_default == True).limit(1))
 
     if not profile:
         raise HTTPException(status_code=404, detail="No default profile found")
 
-    return profile.to_dict()
+    profile_dict = profile.to_dict()
+    default_profile_cache.set(DEFAULT_PROFILE_KEY, profile_dict)
+    return UTCJSONResponse(profile_dict)
 
 
 @router.get("/api/profiles/{profile_id}")
-async def get_profile(profile_id: int, db: Session = Depends(get_db)):
+async def get_profile(profile_id: int, db: AsyncSession = Depends(get_db)):
     """
     Get a specific profile by ID
 
@@ -82,16 +140,16 @@ async def get_profile(profile_id: int, db: Session = Depends(get_db)):
     Returns:
         Profile data as JSON
     """
-    profile = db.query(UserProfile).filter(UserProfile.id == profile_id).first()
+    profile = await db.get(UserProfile, profile_id)
 
     if not profile:
         raise HTTPException(status_code=404, detail="Profile not found")
 
-    return profile.to_dict()
+    return UTCJSONResponse(profile.to_dict())
 
 
 @router.post("/api/profiles")
-async def create_profile(profile_data: ProfileCreate, db: Session = Depends(get_db)):
+async def create_profile(profile_data: ProfileCreate, db: AsyncSession = Depends(get_db)):
     """
     Create a new user profile
 
@@ -101,17 +159,6 @@ async def create_profile(profile_data: ProfileCreate, db: Session = Depends(get_
     Returns:
         Created profile as JSON
     """
-    # Check if profile name already exists
-    existing = db.query(UserProfile).filter(UserProfile.name == profile_data.name).first()
-    if existing:
-        raise HTTPException(status_code=400, detail=f"Profile '{profile_data.name}' already exists")
-
-    # If setting as default, unset any existing default
-    if profile_data.is_default:
-        db.query(UserProfile).filter(UserProfile.is_default == True).update(
-            {'is_default': False}
-        )
-
     # Create new profile
     profile = UserProfile(
         name=profile_data.name,
@@ -122,19 +169,36 @@ async def create_profile(profile_data: ProfileCreate, db: Session = Depends(get_
         focus_areas=profile_data.focus_areas,
         is_default=profile_data.is_default,
     )
+    profile.update_preferences_prompt()
 
     db.add(profile)
-    db.commit()
-    db.refresh(profile)
+    try:
+        # Assigns profile.id inside the open transaction; the unique
+        # constraint on name rejects duplicates without a separate SELECT
+        await db.flush()
+    except IntegrityError as e:
+        await db.rollback()
+        if not _is_duplicate_name(e):
+            raise
+        raise HTTPException(status_code=400, detail=f"Profile '{profile_data.name}' already exists")
+
+    # If setting as default, unset any other default in the same transaction
+    if profile.is_default:
+        await _unset_other_defaults(db, profile.id)
 
-    return profile.to_dict()
+    # No refresh needed: every column default is applied client-side at flush
+    profile_dict = profile.to_dict()
+    await db.commit()
+    default_profile_cache.pop(DEFAULT_PROFILE_KEY)
+
+    return UTCJSONResponse(profile_dict)
 
 
 @router.put("/api/profiles/{profile_id}")
 async def update_profile(
     profile_id: int,
     profile_data: ProfileUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update an existing profile
@@ -146,37 +210,52 @@ async def update_profile(
     Returns:
         Updated profile as JSON
     """
-    # Get existing profile
-    profile = db.query(UserProfile).filter(UserProfile.id == profile_id).first()
+    update_data = profile_data.model_dump(exclude_unset=True)
+
+    if not update_data:
+        profile = await db.get(UserProfile, profile_id)
+        if not profile:
+            raise HTTPException(status_code=404, detail="Profile not found")
+        return UTCJSONResponse(profile.to_dict())
+
+    # Apply the provided fields and read the row back in one UPDATE ... RETURNING;
+    # the unique constraint on name rejects conflicts without a pre-check SELECT
+    try:
+        profile = await db.scalar(
+            update(UserProfile)
+            .where(UserProfile.id == profile_id)
+            .values(**update_data)
+            .returning(UserProfile)
+        )
+    except IntegrityError as e:
+        await db.rollback()
+        if not _is_duplicate_name(e):
+            raise
+        raise HTTPException(status_code=400, detail=f"Profile '{profile_data.name}' already exists")
 
     if not profile:
         raise HTTPException(status_code=404, detail="Profile not found")
 
-    # Check if new name conflicts with existing profile
-    if profile_data.name and profile_data.name != profile.name:
-        existing = db.query(UserProfile).filter(UserProfile.name == profile_data.name).first()
-        if existing:
-            raise HTTPException(status_code=400, detail=f"Profile '{profile_data.name}' already exists")
+    # Changed preferences: rebuild the saved prompt block
+    if update_data.keys() & PREFERENCE_FIELDS:
+        profile.update_preferences_prompt()
 
-    # If setting as default, unset any existing default
+    # If setting as default, unset any other default (same transaction as the update)
     if profile_data.is_default:
-        db.query(UserProfile).filter(UserProfile.is_default == True).update(
-            {'is_default': False}
-        )
-
-    # Update fields (only update fields that were provided)
-    update_data = profile_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(profile, field, value)
+        await _unset_other_defaults(db, profile_id)
 
-    db.commit()
-    db.refresh(profile)
+    # Write the prompt rebuild before reading the row back, so the response
+    # matches what is committed (including updated_at)
+    await db.flush()
+    profile_dict = profile.to_dict()
+    await db.commit()
+    default_profile_cache.pop(DEFAULT_PROFILE_KEY)
 
-    return profile.to_dict()
+    return UTCJSONResponse(profile_dict)
 
 
 @router.delete("/api/profiles/{profile_id}")
-async def delete_profile(profile_id: int, db: Session = Depends(get_db)):
+async def delete_profile(profile_id: int, db: AsyncSession = Depends(get_db)):
     """
     Delete a profile
 
@@ -186,24 +265,29 @@ async def delete_profile(profile_id: int, db: Session = Depends(get_db)):
     Returns:
         Success message
     """
-    # Get profile
-    profile = db.query(UserProfile).filter(UserProfile.id == profile_id).first()
+    # Delete in one statement unless the profile is the default
+    name = await db.scalar(
+        delete(UserProfile)
+        .where(UserProfile.id == profile_id, UserProfile.is_default == False)
+        .returning(UserProfile.name)
+    )
 
-    if not profile:
-        raise HTTPException(status_code=404, detail="Profile not found")
+    if name is None:
+        # Nothing deleted: either no such profile or it's the default
+        profile = await db.get(UserProfile, profile_id)
+        if not profile:
+            raise HTTPException(status_code=404, detail="Profile not found")
 
-    # Don't allow deleting the default profile
-    if profile.is_default:
+        # Don't allow deleting the default profile
         raise HTTPException(
             status_code=400,
             detail="Cannot delete the default profile. Set another profile as default first."
         )
 
-    # Delete profile
-    db.delete(profile)
-    db.commit()
+    await db.commit()
+    default_profile_cache.pop(DEFAULT_PROFILE_KEY)
 
     return {
         'success': True,
-        'message': f"Profile '{profile.name}' deleted successfully"
+        'message': f"Profile '{name}' deleted successfully"
     }
@@ -2,41 +2,236 @@
 Study routes - API endpoints for study generation and retrieval
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Form, Request
-from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
-from typing import Optional
-import markdown
-
-from ..database import get_db
-from ..models import Study, UserProfile
-from ..services.study_generator import StudyGeneratorService
-from ..config import WebConfig
+import asyncio
+from functools import lru_cache
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Form, Query, Request
+from fastapi.responses import RedirectResponse, StreamingResponse
+from sqlalchemy import func, insert, select, update, text as sql_text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+import orjson
+
+from ..database import get_db, SessionLocal
+from ..models import Study, UserProfile, STUDY_SUMMARY_COLUMNS, STUDY_LIST_COLUMNS
+from ..services.study_generator import StudyGeneratorService, GenerateSpec, PreparedBatch
+from ..services.markdown_renderer import render_markdown
+from ..config import get_config
+from ..cache import study_count_cache, _invalidate_study_caches
+from ..responses import ORJSON_OPTIONS, UTCJSONResponse
 from lectionary_engines.preferences import StudyPreferences
+from lectionary_engines.text_fetcher import RCL_READING_TYPES
 import json
 
 router = APIRouter()
 
-# Load configuration
-config = WebConfig.load()
+# Rows fetched per round trip when streaming an export
+EXPORT_BATCH_SIZE = 200
 
-# Initialize study generator service (singleton pattern)
-_generator_service = None
+# Columns written by the NDJSON export (the full study, minus file sync state)
+EXPORT_COLUMNS = STUDY_SUMMARY_COLUMNS + (
+    Study.content,
+    Study.biblical_text,
+    Study.profile_name,
+    Study.validation_score,
+    Study.validation_recommendation,
+)
 
 
+@lru_cache(maxsize=1)
 def get_generator_service() -> StudyGeneratorService:
-    """Get or create study generator service instance"""
-    global _generator_service
-    if _generator_service is None:
-        _generator_service = StudyGeneratorService(
-            api_key=config.anthropic_api_key,
-            default_translation=config.default_translation
-        )
-    return _generator_service
+    """
+    Study generator service shared by every request in this worker
+
+    Built on first use and then reused, so all requests share its HTTP
+    connection pools and in-memory caches.
+    """
+    config = get_config()
+    return StudyGeneratorService(
+        api_key=config.anthropic_api_key,
+        default_translation=config.default_translation
+    )
+
+
+async def _build_preferences(
+    profile_id: Optional[int],
+    custom_study_length: Optional[str],
+    custom_tone_level: Optional[int],
+    custom_language_complexity: Optional[str],
+    custom_focus_areas: Optional[str],
+    custom_cultural_artifacts_level: Optional[int]
+):
+    """
+    Build study preferences from a saved profile plus per-study overrides
+
+    The profile is read in a short session of its own, so callers don't
+    hold a pooled connection (or an open transaction) through the text
+    fetch and Claude call that follow.
+
+    Returns:
+        tuple: (preferences, profile_name, custom_prefs_json); all None when
+        no profile is selected
+    """
+    preferences = None
+    profile_name = None
+    custom_prefs_json = None
+
+    if profile_id:
+        # Load profile from database
+        async with SessionLocal() as db:
+            profile = await db.scalar(select(UserProfile).where(UserProfile.id == profile_id))
+        if profile:
+            profile_name = profile.name
+            # Convert profile to StudyPreferences
+            preferences = profile.to_study_preferences()
+
+            # Apply custom overrides
+            custom_overrides = {}
+            if custom_study_length:
+                preferences.study_length = custom_study_length
+                custom_overrides['study_length'] = custom_study_length
+            if custom_tone_level is not None and custom_tone_level >= 0:
+                preferences.tone_level = custom_tone_level
+                custom_overrides['tone_level'] = custom_tone_level
+            if custom_language_complexity:
+                preferences.language_complexity = custom_language_complexity
+                custom_overrides['language_complexity'] = custom_language_complexity
+            if custom_focus_areas:
+                preferences.focus_areas = custom_focus_areas
+                custom_overrides['focus_areas'] = custom_focus_areas
+            if custom_cultural_artifacts_level is not None and custom_cultural_artifacts_level > 0:
+                preferences.cultural_artifacts_level = custom_cultural_artifacts_level
+                custom_overrides['cultural_artifacts_level'] = custom_cultural_artifacts_level
+
+            # Save custom overrides as JSON if any; the profile's saved
+            # prompt fragment no longer matches, so engines rebuild it
+            if custom_overrides:
+                preferences.prompt_fragment = None
+                custom_prefs_json = json.dumps(custom_overrides)
+
+    return preferences, profile_name, custom_prefs_json
+
+
+async def _resolve_text(
+    generator: StudyGeneratorService,
+    source: str,
+    reference: Optional[str],
+    text: Optional[str],
+    translation: Optional[str],
+    rcl_reading: Optional[str]
+) -> tuple[str, Optional[str]]:
+    """
+    Work out the reference and biblical text for the chosen source
+
+    Returns:
+        tuple: (reference, text)
+
+    Raises:
+        ValueError: If no reference is available
+    """
+    # Handle different text sources
+    if source == "moravian":
+        # Fetch Moravian Daily Text
+        reference, text = await generator.fetch_moravian()
+    elif source == "rcl":
+        # Fetch RCL reading
+        reference, text = await generator.fetch_rcl(reading_type=rcl_reading, translation=translation)
+    elif source == "run":
+        # Fetch from Bible Gateway (reference required)
+        if not reference:
+            raise ValueError("Reference is required for Bible Gateway source")
+        text = await generator.fetch_text(reference, translation)
+    # For 'paste' source, reference and text come from form
+
+    if not reference:
+        raise ValueError("Reference is required")
+
+    return reference, text
+
+
+def _start_validation(generator: StudyGeneratorService, study_data: dict) -> asyncio.Task:
+    """
+    Start the validation call for freshly generated content
+
+    Started before the study is saved, so the Claude round trip overlaps
+    the database insert and the response instead of following them.
+
+    Returns:
+        Task resolving to the ValidationResult
+    """
+    return asyncio.create_task(generator.validate_study(
+        biblical_text=study_data['biblical_text'],
+        reference=study_data['reference'],
+        study_content=study_data['content']
+    ))
+
+
+async def run_validation_and_update(study_id: int, validation: asyncio.Task):
+    """
+    Background job: wait for a study's validation and store the result on its row
+
+    Runs after the response has been sent, so it opens its own session.
+    Sets validation_status to 'complete', or 'failed' if validation could
+    not be completed.
+
+    Args:
+        study_id: ID of the saved study
+        validation: Task from _start_validation
+    """
+    values = {'validation_status': 'failed'}
+    try:
+        validation_result = await validation
+        values = {
+            'validation_score': validation_result.overall_score,
+            'validation_recommendation': validation_result.recommendation,
+            'validation_data': validation_result.to_json(),
+            'validation_status': 'failed' if validation_result.validation_error else 'complete',
+        }
+    except Exception as validation_error:
+        # Log but don't fail - validation is non-critical
+        print(f"Validation failed (non-critical): {validation_error}")
+
+    async with SessionLocal() as db:
+        await db.execute(update(Study).where(Study.id == study_id).values(**values))
+        await db.commit()
+
+
+def _study_values(
+    study_data: dict,
+    source: str,
+    translation: Optional[str],
+    profile_name: Optional[str],
+    custom_prefs_json: Optional[str],
+    should_validate: bool
+) -> dict:
+    """
+    Build the column values of the database record for a generated study
+
+    Studies are saved with a Core INSERT ... RETURNING id, so the new id
+    comes back with the insert itself instead of via an ORM object.
+    Validation fields are left empty; with should_validate the study is
+    saved as 'pending' for run_validation_and_update to fill in. The HTML
+    for the study page is rendered here, once.
+    """
+    return {
+        'engine': study_data['engine'],
+        'reference': study_data['reference'],
+        'content': study_data['content'],
+        'content_html': render_markdown(study_data['content']),
+        'word_count': study_data.get('metadata', {}).get('word_count'),
+        'source': source,
+        'translation': translation,
+        'biblical_text': study_data.get('biblical_text'),
+        'profile_name': profile_name,
+        'custom_preferences': custom_prefs_json,
+        'validation_status': 'pending' if should_validate else 'skipped',
+    }
 
 
 @router.post("/generate")
 async def generate_study(
+    background_tasks: BackgroundTasks,
     engine: str = Form(...),
     reference: Optional[str] = Form(None),
     text: Optional[str] = Form(None),
@@ -50,7 +245,7 @@ async def generate_study(
     custom_focus_areas: Optional[str] = Form(None),
     custom_cultural_artifacts_level: Optional[int] = Form(None),
     run_validation: Optional[str] = Form("true"),  # "true" or "false"
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Generate a new study and save to database
@@ -61,132 +256,452 @@ async def generate_study(
         - text: Biblical text (optional, will fetch if not provided)
         - translation: Bible translation (default: NRSVue)
         - source: Source type ('paste', 'run', 'moravian', 'rcl')
-        - rcl_reading: RCL reading type (only for rcl source)
+        - rcl_reading: RCL reading type, or 'all' for one study per reading
+          (only for rcl source)
 
     Returns:
-        Redirect to study view page
+        Redirect to study view page (or to Browse for 'all')
     """
     try:
         # Get generator service
         generator = get_generator_service()
 
         # Build preferences from profile and custom overrides
-        preferences = None
-        profile_name = None
-        custom_prefs_json = None
-
-        if profile_id:
-            # Load profile from database
-            profile = db.query(UserProfile).filter(UserProfile.id == profile_id).first()
-            if profile:
-                profile_name = profile.name
-                # Convert profile to StudyPreferences
-                preferences = profile.to_study_preferences()
-
-                # Apply custom overrides
-                custom_overrides = {}
-                if custom_study_length:
-                    preferences.study_length = custom_study_length
-                    custom_overrides['study_length'] = custom_study_length
-                if custom_tone_level is not None and custom_tone_level >= 0:
-                    preferences.tone_level = custom_tone_level
-                    custom_overrides['tone_level'] = custom_tone_level
-                if custom_language_complexity:
-                    preferences.language_complexity = custom_language_complexity
-                    custom_overrides['language_complexity'] = custom_language_complexity
-                if custom_focus_areas:
-                    preferences.focus_areas = custom_focus_areas
-                    custom_overrides['focus_areas'] = custom_focus_areas
-                if custom_cultural_artifacts_level is not None and custom_cultural_artifacts_level > 0:
-                    preferences.cultural_artifacts_level = custom_cultural_artifacts_level
-                    custom_overrides['cultural_artifacts_level'] = custom_cultural_artifacts_level
-
-                # Save custom overrides as JSON if any
-                if custom_overrides:
-                    custom_prefs_json = json.dumps(custom_overrides)
-
-        # Handle different text sources
-        if source == "moravian":
-            # Fetch Moravian Daily Text
-            reference, text = generator.fetch_moravian()
-        elif source == "rcl":
-            # Fetch RCL reading
-            reference, text = generator.fetch_rcl(reading_type=rcl_reading, translation=translation)
-        elif source == "run":
-            # Fetch from Bible Gateway (reference required)
-            if not reference:
-                raise ValueError("Reference is required for Bible Gateway source")
-            text = generator.fetch_text(reference, translation)
-        # For 'paste' source, reference and text come from form
+        preferences, profile_name, custom_prefs_json = await _build_preferences(
+            profile_id, custom_study_length, custom_tone_level,
+            custom_language_complexity, custom_focus_areas, custom_cultural_artifacts_level
+        )
 
-        if not reference:
-            raise ValueError("Reference is required")
+        if source == "rcl" and rcl_reading == "all":
+            # All four readings: fetched together, then studied concurrently
+            readings = list((await generator.fetch_rcl_all(translation)).values())
+        else:
+            readings = [await _resolve_text(generator, source, reference, text, translation, rcl_reading)]
+
+        # Generate studies (awaits the Claude API - may take 30-60 seconds,
+        # during which this worker keeps serving other requests)
+        results = await generator.generate_concurrently([
+            GenerateSpec(
+                engine_name=engine,
+                reference=reading_reference,
+                text=reading_text,
+                translation=translation,
+                source=source,
+                preferences=preferences
+            )
+            for reading_reference, reading_text in readings
+        ])
+
+        # Start the validation pass (if enabled) now, so it runs while the
+        # studies are saved and the redirect is sent; the study page shows
+        # it as pending until the result is stored
+        should_validate = bool(run_validation and run_validation.lower() == "true")
+        validations = [_start_validation(generator, study_data) for study_data in results] if should_validate else []
+
+        # Save to database; ids come back in the same order as the rows
+        rows = [
+            _study_values(study_data, source, translation, profile_name, custom_prefs_json, should_validate)
+            for study_data in results
+        ]
+        try:
+            study_ids = (await db.scalars(
+                insert(Study).returning(Study.id, sort_by_parameter_order=True), rows
+            )).all()
+            await db.commit()
+        except Exception:
+            for validation in validations:
+                validation.cancel()
+            raise
+
+        _invalidate_study_caches()
+
+        for study_id, validation in zip(study_ids, validations):
+            background_tasks.add_task(run_validation_and_update, study_id, validation)
+
+        # Redirect to the study view page, or to today's RCL studies when
+        # several were generated
+        if len(study_ids) == 1:
+            return RedirectResponse(url=f"/study/{study_ids[0]}", status_code=303)
+        return RedirectResponse(url="/browse?source=rcl", status_code=303)
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Study generation failed: {str(e)}")
+
+
+async def _save_batch(batch: PreparedBatch, translation: Optional[str], profile_name: Optional[str]):
+    """
+    Background job: wait for a submitted batch and save its studies
+
+    Studies that failed in the batch are skipped (and logged).
+
+    Args:
+        batch: Result of StudyGeneratorService.submit_batch
+        translation: Translation requested for the batch
+        profile_name: Profile used for the batch (if any)
+    """
+    try:
+        results = await get_generator_service().collect_batch(batch)
+    except Exception as e:
+        print(f"Batch {batch.batch_id} failed: {e}")
+        return
+
+    rows = [
+        _study_values(study_data, spec.source, translation, profile_name, None, should_validate=False)
+        for spec, study_data in zip(batch.specs, results)
+        if study_data is not None
+    ]
+    failed = len(results) - len(rows)
+    if failed:
+        print(f"Batch {batch.batch_id}: {failed} of {len(results)} studies failed")
+
+    if rows:
+        async with SessionLocal() as db:
+            await db.execute(insert(Study), rows)
+            await db.commit()
+
+        _invalidate_study_caches()
+
+
+@router.post("/generate/batch", status_code=202)
+async def generate_batch(
+    background_tasks: BackgroundTasks,
+    engines: List[str] = Form(...),
+    source: str = Form("rcl"),
+    rcl_readings: Optional[List[str]] = Form(None),
+    reference: Optional[str] = Form(None),
+    text: Optional[str] = Form(None),
+    translation: Optional[str] = Form("NRSVue"),
+    profile_id: Optional[int] = Form(None)
+):
+    """
+    Generate several studies at once through the Message Batches API
+
+    Every selected engine is run on every selected text. Batched requests
+    cost half as much but can take minutes, so this returns as soon as the
+    batch is submitted and the studies appear in Browse once it completes.
+    Batched studies are not validated.
+
+    Form fields:
+        - engines: One or more engine names (repeat the field)
+        - source: Source type ('rcl' for today's readings, or 'paste'/'run'/'moravian')
+        - rcl_readings: RCL reading types to use (default: all four; rcl source only)
+        - reference, text, translation: As for /generate
+        - profile_id: Profile whose preferences apply to every study
+
+    Returns:
+        Batch ID and number of studies submitted (202 Accepted)
+    """
+    unknown_readings = [reading for reading in rcl_readings or () if reading not in RCL_READING_TYPES]
+    if unknown_readings:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid rcl_readings: {', '.join(unknown_readings)}. "
+                   f"Must be one of: {', '.join(RCL_READING_TYPES)}"
+        )
 
-        # Generate study (this calls Claude API - may take 30-60 seconds)
-        # Pass preferences if available
-        study_data = generator.generate_study(
+    try:
+        generator = get_generator_service()
+
+        preferences, profile_name, _ = await _build_preferences(
+            profile_id, None, None, None, None, None
+        )
+
+        # Texts to study: today's selected RCL readings (fetched together),
+        # or the single text for any other source
+        if source == "rcl":
+            all_readings = await generator.fetch_rcl_all(translation)
+            readings = [all_readings[reading_type] for reading_type in (rcl_readings or RCL_READING_TYPES)]
+        else:
+            readings = [await _resolve_text(generator, source, reference, text, translation, None)]
+
+        specs = [
+            GenerateSpec(
+                engine_name=engine,
+                reference=reading_reference,
+                text=reading_text,
+                translation=translation,
+                source=source,
+                preferences=preferences
+            )
+            for reading_reference, reading_text in readings
+            for engine in engines
+        ]
+        batch = await generator.submit_batch(specs)
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Batch submission failed: {str(e)}")
+
+    background_tasks.add_task(_save_batch, batch, translation, profile_name)
+
+    return {
+        'batch_id': batch.batch_id,
+        'count': len(specs),
+    }
+
+
+def _sse(event: str, data: dict) -> bytes:
+    """Format one Server-Sent Events frame with a JSON payload"""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+async def _study_event_stream(
+    generator: StudyGeneratorService,
+    engine: str,
+    reference: str,
+    text: Optional[str],
+    translation: Optional[str],
+    source: str,
+    preferences: Optional[StudyPreferences],
+    profile_name: Optional[str],
+    custom_prefs_json: Optional[str],
+    should_validate: bool,
+    background_tasks: BackgroundTasks
+):
+    """
+    Yield SSE frames for a study as Claude writes it, then save it
+
+    Frames:
+        - token: {"token": str} for each chunk of generated text
+        - done: {"study_id": int, "url": str, "validation_status": str}
+          once the study is saved
+        - error: {"detail": str} if generation fails part-way (the request
+          itself is checked before the stream starts)
+    """
+    try:
+        study_data = None
+        async for item in generator.generate_study_stream(
             engine_name=engine,
             reference=reference,
             text=text,
             translation=translation,
             source=source,
             preferences=preferences
-        )
+        ):
+            if 'token' in item:
+                yield _sse('token', item)
+            else:
+                study_data = item['study']
 
-        # Run validation pass (if enabled)
-        validation_score = None
-        validation_recommendation = None
-        validation_data_json = None
-
-        should_validate = run_validation and run_validation.lower() == "true"
+        # Start the validation pass (if enabled) so it overlaps the save
         if should_validate:
-            try:
-                validation_result = generator.validate_study(
-                    biblical_text=study_data.get('biblical_text', text),
-                    reference=reference,
-                    study_content=study_data['content']
-                )
-                validation_score = validation_result.overall_score
-                validation_recommendation = validation_result.recommendation
-                validation_data_json = json.dumps(validation_result.to_dict())
-            except Exception as validation_error:
-                # Log but don't fail - validation is non-critical
-                print(f"Validation failed (non-critical): {validation_error}")
-                validation_recommendation = "skipped"
-
-        # Create database record
-        study = Study(
-            engine=study_data['engine'],
-            reference=study_data['reference'],
-            content=study_data['content'],
-            word_count=study_data.get('metadata', {}).get('word_count'),
-            source=source,
-            translation=translation,
-            biblical_text=study_data.get('biblical_text'),
-            reference_normalized=reference.lower().strip(),
-            profile_name=profile_name,
-            custom_preferences=custom_prefs_json,
-            validation_score=validation_score,
-            validation_recommendation=validation_recommendation,
-            validation_data=validation_data_json
-        )
+            validation = _start_validation(generator, study_data)
+
+        # The request's session is closed before a streamed body is sent,
+        # so the study is saved in a session of its own
+        values = _study_values(study_data, source, translation, profile_name, custom_prefs_json, should_validate)
+        try:
+            async with SessionLocal() as db:
+                study_id = (await db.execute(
+                    insert(Study).values(**values).returning(Study.id)
+                )).scalar_one()
+                await db.commit()
+        except Exception:
+            if should_validate:
+                validation.cancel()
+            raise
+
+        _invalidate_study_caches()
+
+        # The result is stored once the stream has been sent
+        if should_validate:
+            background_tasks.add_task(run_validation_and_update, study_id, validation)
+
+        yield _sse('done', {
+            'study_id': study_id,
+            'url': f"/study/{study_id}",
+            'validation_status': values['validation_status'],
+        })
+
+    except Exception as e:
+        yield _sse('error', {'detail': f"Study generation failed: {str(e)}"})
+
+
+@router.post("/generate/stream")
+async def generate_study_stream(
+    background_tasks: BackgroundTasks,
+    engine: str = Form(...),
+    reference: Optional[str] = Form(None),
+    text: Optional[str] = Form(None),
+    translation: Optional[str] = Form("NRSVue"),
+    source: str = Form("paste"),
+    rcl_reading: Optional[str] = Form("gospel"),
+    profile_id: Optional[int] = Form(None),
+    custom_study_length: Optional[str] = Form(None),
+    custom_tone_level: Optional[int] = Form(None),
+    custom_language_complexity: Optional[str] = Form(None),
+    custom_focus_areas: Optional[str] = Form(None),
+    custom_cultural_artifacts_level: Optional[int] = Form(None),
+    run_validation: Optional[str] = Form("true")  # "true" or "false"
+):
+    """
+    Generate a new study, streaming it as Server-Sent Events
+
+    Takes the same form fields as /generate. Instead of redirecting once the
+    study is finished, streams the text as it is generated (token events)
+    and ends with a done event carrying the saved study's id and URL.
+
+    Returns:
+        text/event-stream response
+    """
+    generator = get_generator_service()
 
-        # Save to database
-        db.add(study)
-        db.commit()
-        db.refresh(study)
+    # Build preferences from profile and custom overrides
+    preferences, profile_name, custom_prefs_json = await _build_preferences(
+        profile_id, custom_study_length, custom_tone_level,
+        custom_language_complexity, custom_focus_areas, custom_cultural_artifacts_level
+    )
 
-        # Redirect to study view page
-        return RedirectResponse(url=f"/study/{study.id}", status_code=303)
+    if source == "rcl" and rcl_reading == "all":
+        raise HTTPException(status_code=400, detail="Streaming generates one study; choose a single RCL reading")
 
+    # Check the request and resolve the text before streaming starts, so a
+    # bad engine, preference or reference is a plain 400; once the stream
+    # has begun, only Claude and text-fetch failures are left, sent as an
+    # error event
+    try:
+        generator.check_request(engine, preferences)
+        reference, text = await _resolve_text(generator, source, reference, text, translation, rcl_reading)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Study generation failed: {str(e)}")
 
+    should_validate = bool(run_validation and run_validation.lower() == "true")
+
+    return StreamingResponse(
+        _study_event_stream(
+            generator, engine, reference, text, translation, source,
+            preferences, profile_name, custom_prefs_json, should_validate,
+            background_tasks
+        ),
+        media_type="text/event-stream",
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+def _fts_match_query(q: str) -> str:
+    """
+    Turn free-text input into an FTS5 MATCH expression
+
+    Each whitespace-separated term is quoted (FTS5 operators and punctuation
+    in user input are treated literally) and all terms must match.
+    """
+    return ' '.join('"' + term.replace('"', '""') + '"' for term in q.split())
+
+
+# Declared before /api/studies/{study_id} so "search" isn't taken as an id
+@router.get("/api/studies/search")
+async def search_studies_api(
+    q: str,
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Full-text search over study references, content and biblical text
+
+    Query parameters:
+        - q: Search terms (all must match)
+        - limit: Maximum number of results (default 50)
+
+    Returns:
+        Matching studies (summary fields only), best match first
+    """
+    if not q.strip():
+        raise HTTPException(status_code=400, detail="Search query is required")
+
+    rows = None
+    if db.bind.dialect.name == "sqlite":
+        try:
+            # Ranked ids from the FTS5 index, then the summary rows for those ids
+            result = await db.execute(
+                sql_text("SELECT rowid FROM studies_fts WHERE studies_fts MATCH :q ORDER BY rank LIMIT :limit"),
+                {'q': _fts_match_query(q), 'limit': limit}
+            )
+            ids = result.scalars().all()
+            rows = (await db.execute(
+                select(*STUDY_LIST_COLUMNS).where(Study.id.in_(ids))
+            )).all() if ids else []
+            rank = {study_id: position for position, study_id in enumerate(ids)}
+            rows.sort(key=lambda row: rank[row.id])
+        except OperationalError:
+            # No studies_fts table (migration 004 not applied); the failed
+            # statement leaves the transaction unusable until rolled back
+            await db.rollback()
+
+    if rows is None:
+        # No FTS5 index (non-SQLite database, or SQLite without migration
+        # 004): fall back to a substring match on the reference
+        result = await db.execute(
+            select(*STUDY_LIST_COLUMNS)
+            .where(Study.reference_normalized.contains(q.strip().lower(), autoescape=True))
+            .order_by(Study.created_at.desc())
+            .limit(limit)
+        )
+        rows = result.all()
+
+    studies = [Study.to_summary_dict(row) for row in rows]
+    return UTCJSONResponse({
+        'query': q,
+        'total': len(studies),
+        'studies': studies
+    })
+
+
+async def _export_ndjson(filters: list):
+    """
+    Yield studies matching filters as NDJSON lines, oldest first
+
+    Opens its own session: a request-scoped session from get_db is closed
+    before a StreamingResponse body is consumed. Rows are pulled from the
+    database EXPORT_BATCH_SIZE at a time, so memory use stays flat however
+    many studies (and however much content) the table holds.
+    """
+    async with SessionLocal() as db:
+        result = await db.stream(
+            select(*EXPORT_COLUMNS)
+            .where(*filters)
+            .order_by(Study.id)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        async for row in result:
+            yield orjson.dumps(row._asdict(), option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+
+
+# Declared before /api/studies/{study_id} so "export" isn't taken as an id
+@router.get("/api/studies/export")
+async def export_studies_api(
+    engine: Optional[str] = None,
+    source: Optional[str] = None
+):
+    """
+    Export studies as newline-delimited JSON (one study per line)
+
+    Query parameters:
+        - engine: Filter by engine name
+        - source: Filter by source type
+
+    Returns:
+        Streaming application/x-ndjson response
+    """
+    filters = []
+    if engine:
+        filters.append(Study.engine == engine)
+    if source:
+        filters.append(Study.source == source)
+
+    return StreamingResponse(
+        _export_ndjson(filters),
+        media_type="application/x-ndjson",
+        headers={'Content-Disposition': 'attachment; filename="studies.ndjson"'}
+    )
+
 
 @router.get("/api/studies/{study_id}")
-async def get_study_api(study_id: int, db: Session = Depends(get_db)):
+async def get_study_api(study_id: int, db: AsyncSession = Depends(get_db)):
     """
     Get study by ID (API endpoint - returns JSON)
 
@@ -194,14 +709,44 @@ async def get_study_api(study_id: int, db: Session = Depends(get_db)):
         study_id: Study ID
 
     Returns:
-        Study data as JSON
+        Study data as JSON; validation_data is the stored validation result
+        as a nested object (null if not validated)
     """
-    study = db.query(Study).filter(Study.id == study_id).first()
+    study = await db.scalar(select(Study).where(Study.id == study_id))
 
     if not study:
         raise HTTPException(status_code=404, detail="Study not found")
 
-    return study.to_dict()
+    data = study.to_dict()
+    if study.validation_data:
+        # Stored as JSON text already: embed it as-is rather than parsing it
+        # only for it to be serialized again
+        data['validation_data'] = orjson.Fragment(study.validation_data)
+
+    # Returned as a response, so FastAPI's jsonable_encoder (which can't
+    # encode a Fragment) never sees it
+    return UTCJSONResponse(data)
+
+
+@router.get("/api/studies/{study_id}/validation-status")
+async def get_study_validation_status_api(study_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    Get only a study's validation status (polled by the study page)
+
+    Args:
+        study_id: Study ID
+
+    Returns:
+        {"validation_status": str}; 'pending' until the background
+        validation stores its result
+    """
+    result = await db.execute(select(Study.validation_status).where(Study.id == study_id))
+    row = result.first()
+
+    if row is None:
+        raise HTTPException(status_code=404, detail="Study not found")
+
+    return UTCJSONResponse({'validation_status': row.validation_status})
 
 
 @router.get("/api/studies")
@@ -210,7 +755,8 @@ async def list_studies_api(
     limit: int = 20,
     engine: Optional[str] = None,
     source: Optional[str] = None,
-    db: Session = Depends(get_db)
+    reference: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
 ):
     """
     List studies with optional filtering (API endpoint - returns JSON)
@@ -220,30 +766,50 @@ async def list_studies_api(
         - limit: Maximum number of studies to return
         - engine: Filter by engine name
         - source: Filter by source type
+        - reference: Filter by reference (exact match, ignoring case and
+          surrounding whitespace)
 
     Returns:
-        List of studies as JSON
+        List of studies as JSON (summary fields only; fetch
+        /api/studies/{study_id} for the full study)
     """
-    query = db.query(Study)
-
     # Apply filters
+    filters = []
     if engine:
-        query = query.filter(Study.engine == engine)
+        filters.append(Study.engine == engine)
     if source:
-        query = query.filter(Study.source == source)
-
-    # Order by most recent first
-    query = query.order_by(Study.created_at.desc())
-
-    # Get total count before pagination
-    total = query.count()
-
-    # Apply pagination
-    studies = query.offset(skip).limit(limit).all()
-
-    return {
+        filters.append(Study.source == source)
+    if reference:
+        # Equality on the indexed generated column, normalized the same way
+        filters.append(Study.reference_normalized == reference.strip().lower())
+
+    # Get total count before pagination (cached briefly per filter, since
+    # counting scans every matching row)
+    count_key = (engine or '', source or '', reference.strip().lower() if reference else '')
+    total = study_count_cache.get(count_key)
+    if total is None:
+        total = await db.scalar(select(func.count()).select_from(Study).where(*filters))
+        study_count_cache.set(count_key, total)
+
+    # Apply pagination, most recent first; only the list columns are
+    # selected, so content and other large TEXT columns stay in the database
+    result = await db.execute(
+        select(*STUDY_LIST_COLUMNS)
+        .where(*filters)
+        .order_by(Study.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    # Column names are read once for the page and zipped onto each plain
+    # row tuple, rather than building a mapping view per row
+    keys = tuple(result.keys())
+    studies = [dict(zip(keys, row)) for row in result.all()]
+
+    # Returned as a response so the page is serialized by orjson in one
+    # call, without FastAPI's jsonable_encoder pass (datetimes marked UTC)
+    return UTCJSONResponse({
         'total': total,
         'skip': skip,
         'limit': limit,
-        'studies': [study.to_dict() for study in studies]
-    }
+        'studies': studies
+    })
@@ -0,0 +1,29 @@
+"""
+Markdown rendering for study content
+
+Studies are rendered to HTML once, when they are saved, and the HTML is
+stored on the row (Study.content_html), so viewing a study is a plain
+string read. Rows saved before that column existed are rendered on first
+view and written back.
+"""
+
+from markdown_it import MarkdownIt
+
+# Parser built once per process. CommonMark plus the two behaviours study
+# pages relied on from the previous renderer: GFM tables, and single
+# newlines rendered as <br>. MarkdownIt.render keeps no per-document state,
+# so one instance is safe to share.
+_markdown = MarkdownIt("commonmark", {"breaks": True}).enable("table")
+
+
+def render_markdown(content: str) -> str:
+    """
+    Render study markdown to HTML
+
+    Args:
+        content: Study content (markdown)
+
+    Returns:
+        HTML fragment for the study page
+    """
+    return _markdown.render(content)
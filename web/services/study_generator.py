@@ -5,22 +5,59 @@ Wraps existing engine classes for web application use
 Includes validation pass for accuracy, helpfulness, and faithfulness checking.
 """
 
+import asyncio
 import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from functools import partial
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, AsyncIterator, List, Tuple
+
+import httpx
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from lectionary_engines.claude_client import ClaudeClient
+from lectionary_engines.claude_client import ClaudeClient, AsyncClaudeClient
 from lectionary_engines.engines.threshold import ThresholdEngine
 from lectionary_engines.engines.palimpsest import PalimpsestEngine
 from lectionary_engines.engines.collision import CollisionEngine
-from lectionary_engines.text_fetcher import TextFetcher
+from lectionary_engines.text_fetcher import TextFetcher, RCL_READING_TYPES
 from lectionary_engines.preferences import StudyPreferences
 from lectionary_engines.protocols import validation_protocol
 from lectionary_engines.validation import ValidationResult
 
+from ..database import SessionLocal
+from ..models import BiblicalTextCache, DailyReading
+
+# Passages kept in memory per worker, in front of the biblical_text_cache table
+TEXT_CACHE_SIZE = 256
+
+# Connection pool for async Claude calls, shared by every request in a worker
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+
+
+@dataclass
+class GenerateSpec:
+    """One study to generate (the arguments of StudyGeneratorService.generate_study)"""
+    engine_name: str
+    reference: str
+    text: Optional[str] = None
+    translation: Optional[str] = None
+    source: str = 'paste'
+    preferences: Optional[StudyPreferences] = None
+
+
+@dataclass
+class PreparedBatch:
+    """A submitted batch, plus what's needed to package its results"""
+    batch_id: str
+    specs: List[GenerateSpec]
+    prepared: List[tuple]  # _prepare() result for each spec, in order
+
 
 class StudyGeneratorService:
     """
@@ -39,9 +76,19 @@ class StudyGeneratorService:
             default_translation: Default Bible translation to use
         """
         self.claude = ClaudeClient(api_key)
+        self.http_client = httpx.AsyncClient(limits=HTTP_LIMITS)
+        self.async_claude = AsyncClaudeClient(api_key, http_client=self.http_client)
         self.fetcher = TextFetcher(default_translation)
         self.default_translation = default_translation
 
+        # Today's Moravian/RCL readings, keyed by (day, kind, translation);
+        # in front of the daily_readings table
+        self._daily_readings: Dict[Tuple[str, str, str], Tuple[str, str]] = {}
+
+        # Fetched passages, keyed by (normalized reference, translation);
+        # least recently used first
+        self._texts: OrderedDict[Tuple[str, str], str] = OrderedDict()
+
         # Initialize all three engines
         self.engines = {
             'threshold': ThresholdEngine(self.claude),
@@ -49,7 +96,7 @@ class StudyGeneratorService:
             'collision': CollisionEngine(self.claude)
         }
 
-    def generate_study(
+    async def generate_study(
         self,
         engine_name: str,
         reference: str,
@@ -83,45 +130,233 @@ class StudyGeneratorService:
             ValueError: If engine_name is invalid
             Exception: If study generation fails
         """
-        # Validate engine name
-        if engine_name not in self.engines:
-            raise ValueError(
-                f"Invalid engine: {engine_name}. "
-                f"Must be one of: {', '.join(self.engines.keys())}"
+        engine, request, text, actual_translation = await self._prepare(
+            engine_name, reference, text, translation, preferences
+        )
+
+        # Generate the study (this is the core work - awaits the Claude API)
+        output = await self.async_claude.generate_study(
+            text=request['user_message'],
+            reference=reference,
+            system_prompt=request['system_prompt'],
+            max_tokens=request['max_tokens'],
+        )
+
+        study = engine.package_study(reference, output, request)
+        return self._add_web_metadata(study, text, source, actual_translation)
+
+    async def generate_study_stream(
+        self,
+        engine_name: str,
+        reference: str,
+        text: Optional[str] = None,
+        translation: Optional[str] = None,
+        source: str = 'paste',
+        preferences: Optional[StudyPreferences] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate a study, streaming Claude's output as it is produced
+
+        Takes the same arguments as generate_study.
+
+        Yields:
+            {'token': str} for each chunk of generated text, then a final
+            {'study': dict} with the same shape as generate_study's result
+
+        Raises:
+            ValueError: If engine_name is invalid
+            Exception: If study generation fails
+        """
+        engine, request, text, actual_translation = await self._prepare(
+            engine_name, reference, text, translation, preferences
+        )
+
+        chunks = []
+        async for chunk in self.async_claude.stream_study(
+            text=request['user_message'],
+            reference=reference,
+            system_prompt=request['system_prompt'],
+            max_tokens=request['max_tokens'],
+        ):
+            chunks.append(chunk)
+            yield {'token': chunk}
+
+        study = engine.package_study(reference, ''.join(chunks), request)
+        yield {'study': self._add_web_metadata(study, text, source, actual_translation)}
+
+    async def generate_concurrently(self, specs: List[GenerateSpec]) -> List[Dict[str, Any]]:
+        """
+        Generate several studies at once with concurrent Claude calls
+
+        Unlike generate_many (batched: cheaper, but slow to complete) this
+        returns as soon as the slowest study is done.
+
+        Args:
+            specs: Studies to generate
+
+        Returns:
+            One result per spec, in order (shape as generate_study)
+
+        Raises:
+            ValueError: If an engine name is invalid
+            Exception: If any study fails
+        """
+        return await asyncio.gather(*(
+            self.generate_study(
+                engine_name=spec.engine_name,
+                reference=spec.reference,
+                text=spec.text,
+                translation=spec.translation,
+                source=spec.source,
+                preferences=spec.preferences
             )
+            for spec in specs
+        ))
+
+    async def generate_many(self, specs: List[GenerateSpec]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Generate several studies in one Message Batches request
+
+        Waits for the whole batch, which can take minutes; see submit_batch
+        and collect_batch to do the waiting elsewhere.
+
+        Args:
+            specs: Studies to generate
+
+        Returns:
+            One result per spec, in order (shape as generate_study), or None
+            where that study failed
+        """
+        return await self.collect_batch(await self.submit_batch(specs))
+
+    async def submit_batch(self, specs: List[GenerateSpec]) -> PreparedBatch:
+        """
+        Fetch texts, build the Claude requests and submit them as one batch
+
+        Args:
+            specs: Studies to generate
+
+        Returns:
+            PreparedBatch for collect_batch
+
+        Raises:
+            ValueError: If an engine name is invalid
+        """
+        prepared = await asyncio.gather(*(
+            self._prepare(spec.engine_name, spec.reference, spec.text, spec.translation, spec.preferences)
+            for spec in specs
+        ))
+        batch_id = await self.async_claude.create_batch([
+            self.async_claude.batch_request(
+                custom_id=str(index),
+                text=request['user_message'],
+                system_prompt=request['system_prompt'],
+                max_tokens=request['max_tokens'],
+            )
+            for index, (_, request, _, _) in enumerate(prepared)
+        ])
+        return PreparedBatch(batch_id=batch_id, specs=list(specs), prepared=list(prepared))
+
+    async def collect_batch(self, batch: PreparedBatch) -> List[Optional[Dict[str, Any]]]:
+        """
+        Wait for a submitted batch and package its studies
+
+        Args:
+            batch: Result of submit_batch
+
+        Returns:
+            One result per spec, in order (shape as generate_study), or None
+            where that study failed
+        """
+        outputs = await self.async_claude.wait_for_batch(batch.batch_id)
+
+        studies = []
+        for index, (spec, (engine, request, text, translation)) in enumerate(zip(batch.specs, batch.prepared)):
+            output = outputs.get(str(index))
+            if output is None:
+                studies.append(None)
+                continue
+            study = engine.package_study(spec.reference, output, request)
+            studies.append(self._add_web_metadata(study, text, spec.source, translation))
+        return studies
+
+    async def _prepare(
+        self,
+        engine_name: str,
+        reference: str,
+        text: Optional[str],
+        translation: Optional[str],
+        preferences: Optional[StudyPreferences]
+    ) -> tuple:
+        """
+        Resolve the engine and text and build the Claude request
+
+        Returns:
+            tuple: (engine, request, text, translation)
+
+        Raises:
+            ValueError: If engine_name is invalid
+        """
+        self.check_request(engine_name, preferences)
+        engine = self.engines[engine_name]
 
         # Fetch text if not provided
+        actual_translation = translation or self.default_translation
         if text is None:
-            actual_translation = translation or self.default_translation
-            text = self.fetcher.fetch(reference, actual_translation)
-        else:
-            actual_translation = translation or self.default_translation
+            text = await self.fetch_text(reference, actual_translation)
 
-        # Get the engine
-        engine = self.engines[engine_name]
+        return engine, engine.build_request(text, reference, preferences), text, actual_translation
+
+    def check_request(self, engine_name: str, preferences: Optional[StudyPreferences] = None):
+        """
+        Check the engine name and preferences of a study request
 
-        # Generate the study (this is the core work - calls Claude API)
-        # Use generate_with_preferences if preferences provided
+        Cheap and offline, so callers can reject a bad request before any
+        text is fetched or Claude is called.
+
+        Raises:
+            ValueError: If engine_name or preferences are invalid
+        """
+        self._get_engine(engine_name)
         if preferences:
-            study = engine.generate_with_preferences(text, reference, preferences)
-        else:
-            study = engine.generate(text, reference)
+            preferences.validate()
 
-        # Add web-specific metadata
+    def _get_engine(self, engine_name: str):
+        """
+        Look up an engine by name
+
+        Raises:
+            ValueError: If engine_name is invalid
+        """
+        if engine_name not in self.engines:
+            raise ValueError(
+                f"Invalid engine: {engine_name}. "
+                f"Must be one of: {', '.join(self.engines.keys())}"
+            )
+        return self.engines[engine_name]
+
+    @staticmethod
+    def _add_web_metadata(
+        study: Dict[str, Any],
+        text: str,
+        source: str,
+        translation: str
+    ) -> Dict[str, Any]:
+        """Add the web app's fields (text, source, translation) to an engine result"""
         study['biblical_text'] = text
         study['source'] = source
-        study['translation'] = actual_translation
+        study['translation'] = translation
 
         # Ensure metadata dict exists
         if 'metadata' not in study:
             study['metadata'] = {}
 
         study['metadata']['source'] = source
-        study['metadata']['translation'] = actual_translation
+        study['metadata']['translation'] = translation
 
         return study
 
-    def fetch_text(
+    async def fetch_text(
         self,
         reference: str,
         translation: Optional[str] = None
@@ -129,6 +364,11 @@ class StudyGeneratorService:
         """
         Fetch biblical text from Bible Gateway
 
+        Passage text never changes, so it is cached: in memory (the
+        TEXT_CACHE_SIZE most recently used passages), then in the
+        biblical_text_cache table. Only a miss in both goes to Bible Gateway,
+        in a worker thread since the fetcher is blocking.
+
         Args:
             reference: Biblical reference
             translation: Translation to use (if None, uses default)
@@ -137,33 +377,183 @@ class StudyGeneratorService:
             Biblical text as string
         """
         actual_translation = translation or self.default_translation
-        return self.fetcher.fetch(reference, actual_translation)
+        key = (reference.strip().lower(), actual_translation)
 
-    def fetch_moravian(self) -> tuple[str, str]:
+        text = self._texts.get(key)
+        if text is not None:
+            self._texts.move_to_end(key)
+            return text
+
+        async with SessionLocal() as db:
+            row = await db.get(BiblicalTextCache, key)
+        if row is not None:
+            text = row.text
+        else:
+            # Fetched with no session open, so no pooled connection is held
+            # for the duration of the request to Bible Gateway
+            text = await asyncio.to_thread(self.fetcher.fetch, reference, actual_translation)
+            async with SessionLocal() as db:
+                db.add(BiblicalTextCache(reference_norm=key[0], translation=actual_translation, text=text))
+                try:
+                    await db.commit()
+                except IntegrityError:
+                    # Another request stored it first; same text either way
+                    await db.rollback()
+
+        self._texts[key] = text
+        if len(self._texts) > TEXT_CACHE_SIZE:
+            self._texts.popitem(last=False)
+        return text
+
+    async def fetch_moravian(self) -> tuple[str, str]:
         """
-        Fetch today's Moravian Daily Text
+        Fetch today's Moravian Daily Text (scraped once per day, then cached)
 
         Returns:
             tuple: (reference, text)
         """
-        return self.fetcher.fetch_moravian()
+        return await self._daily_reading('moravian', '', self.fetcher.fetch_moravian)
 
-    def fetch_rcl(
+    async def fetch_rcl(
         self,
         reading_type: str = "gospel",
         translation: Optional[str] = None
     ) -> tuple[str, str]:
         """
-        Fetch today's RCL reading
+        Fetch today's RCL reading (scraped once per day, then cached)
 
         Args:
             reading_type: Type of reading ('ot', 'psalm', 'epistle', 'gospel')
-            translation: Translation to use
+            translation: Translation to use (if None, uses default)
 
         Returns:
             tuple: (reference, text)
         """
-        return self.fetcher.fetch_rcl(reading_type)
+        actual_translation = translation or self.default_translation
+        return await self._daily_reading(
+            f'rcl:{reading_type}',
+            actual_translation,
+            partial(self.fetcher.fetch_rcl, reading_type, actual_translation)
+        )
+
+    async def fetch_rcl_all(self, translation: Optional[str] = None) -> Dict[str, tuple[str, str]]:
+        """
+        Fetch all four of today's RCL readings
+
+        The lectionary page is scraped once and the passages are fetched
+        concurrently (via prefetch_rcl); after that the readings come from
+        the daily cache.
+
+        Args:
+            translation: Translation to use (if None, uses default)
+
+        Returns:
+            dict: {"ot": (reference, text), "psalm": ..., "epistle": ..., "gospel": ...}
+        """
+        await self.prefetch_rcl(translation)
+        readings = await asyncio.gather(*(
+            self.fetch_rcl(reading_type, translation) for reading_type in RCL_READING_TYPES
+        ))
+        return dict(zip(RCL_READING_TYPES, readings))
+
+    async def prefetch_rcl(self, translation: Optional[str] = None):
+        """
+        Store all four of today's RCL readings unless they're already cached
+
+        Lets the first user of the day skip the scrape too.
+
+        Args:
+            translation: Translation to use (if None, uses default)
+        """
+        actual_translation = translation or self.default_translation
+        day = date.today().isoformat()
+
+        async with SessionLocal() as db:
+            cached = set((await db.execute(
+                select(DailyReading.kind).where(
+                    DailyReading.day == day,
+                    DailyReading.translation == actual_translation
+                )
+            )).scalars())
+        if all(f'rcl:{reading_type}' in cached for reading_type in RCL_READING_TYPES):
+            return
+
+        # Scrape outside any session: the fetch (with its retries) can take a
+        # while, and a session would hold a pooled connection throughout
+        readings = await self.fetcher.fetch_rcl_all_async(actual_translation)
+
+        async with SessionLocal() as db:
+            for reading_type, (reference, text) in readings.items():
+                kind = f'rcl:{reading_type}'
+                self._remember_reading((day, kind, actual_translation), (reference, text))
+                if kind not in cached:
+                    db.add(DailyReading(
+                        day=day, kind=kind, translation=actual_translation,
+                        reference=reference, text=text
+                    ))
+            try:
+                await db.commit()
+            except IntegrityError:
+                # Another worker stored them first
+                await db.rollback()
+
+    async def _daily_reading(
+        self,
+        kind: str,
+        translation: str,
+        fetch: Callable[[], Tuple[str, str]]
+    ) -> tuple[str, str]:
+        """
+        Look up today's reading in memory, then the database, then scrape it
+
+        Args:
+            kind: Reading kind ('moravian', 'rcl:gospel', ...)
+            translation: Translation ('' if the reading has no translation choice)
+            fetch: Blocking fetcher returning (reference, text), used on a miss
+
+        Returns:
+            tuple: (reference, text)
+        """
+        key = (date.today().isoformat(), kind, translation)
+        reading = self._daily_readings.get(key)
+        if reading is not None:
+            return reading
+
+        async with SessionLocal() as db:
+            row = await db.get(DailyReading, key)
+        if row is not None:
+            reading = (row.reference, row.text)
+        else:
+            # Scraped with no session open, so no pooled connection is held
+            # for the duration of the fetch
+            reading = await asyncio.to_thread(fetch)
+            async with SessionLocal() as db:
+                db.add(DailyReading(
+                    day=key[0], kind=kind, translation=translation,
+                    reference=reading[0], text=reading[1]
+                ))
+                try:
+                    await db.commit()
+                except IntegrityError:
+                    # Another worker stored it first; same reading either way
+                    await db.rollback()
+
+        self._remember_reading(key, reading)
+        return reading
+
+    def _remember_reading(self, key: Tuple[str, str, str], reading: Tuple[str, str]):
+        """Keep a reading in memory, dropping entries from earlier days"""
+        if any(cached_key[0] != key[0] for cached_key in self._daily_readings):
+            self._daily_readings = {
+                cached_key: value
+                for cached_key, value in self._daily_readings.items()
+                if cached_key[0] == key[0]
+            }
+        self._daily_readings[key] = reading
+
+    async def aclose(self):
+        """Close the shared HTTP connection pool (call on shutdown)"""
+        await self.http_client.aclose()
 
     def list_engines(self) -> list[str]:
         """
@@ -183,7 +573,7 @@ class StudyGeneratorService:
         """
         return TextFetcher.list_translations()
 
-    def validate_study(
+    async def validate_study(
         self,
         biblical_text: str,
         reference: str,
@@ -205,7 +595,7 @@ class StudyGeneratorService:
         """
         try:
             # Call validation API
-            json_response = self.claude.validate_study(
+            json_response = await self.async_claude.validate_study(
                 biblical_text=biblical_text,
                 reference=reference,
                 study_content=study_content,